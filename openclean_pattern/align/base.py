@@ -10,7 +10,50 @@ from abc import ABCMeta, abstractmethod
 from openclean_pattern.datatypes.base import create_gap_token
 from openclean.function.token.base import Token
 
-from typing import List, Dict, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+from typing import List, Dict, Tuple, Any, Callable, Optional
+
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+
+
+def map_groups(func: Callable, args: List[Tuple], n_jobs: Optional[int] = 1, backend: str = BACKEND_THREAD) -> List:
+    """calls func on the arguments of each group and returns the results in the order of args. With more than one
+    job, the groups are dispatched to a thread or process pool, largest group first, where the size of a group is
+    the length of its first argument, so the slowest group doesn't start last.
+
+    Parameters
+    ----------
+    func: callable
+        the function aligning a single group. Has to be picklable for the process backend
+    args: list of tuples
+        the arguments of each group
+    n_jobs: int (default: 1)
+        no. of workers. -1 uses all cpus
+    backend: str (default: 'thread')
+        'thread' or 'process'
+
+    Returns
+    -------
+        list of results
+    """
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    if n_jobs is None or n_jobs <= 1 or len(args) < 2:
+        return [func(*a) for a in args]
+
+    if backend == BACKEND_THREAD:
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
+    elif backend == BACKEND_PROCESS:
+        executor = ProcessPoolExecutor(max_workers=n_jobs)
+    else:
+        raise ValueError('backend: {} not found'.format(backend))
+
+    with executor:
+        futures = dict()
+        for g in sorted(range(len(args)), key=lambda g: -len(args[g][0])):
+            futures[g] = executor.submit(func, *args[g])
+        return [futures[g].result() for g in range(len(args))]
 
 
 class Aligner(metaclass=ABCMeta):
@@ -45,6 +88,21 @@ class Aligner(metaclass=ABCMeta):
         """
         raise NotImplementedError()  # pragma: no cover
 
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the memory of the largest array and the no. of token operations needed to align a group
+        before aligning it. By default, aligners are linear: a single pass over all the tokens.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows of the group
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        return 0, sum(len(row) for row in column)
+
 
 class Sequence(tuple):
     """A sequence of tokens"""
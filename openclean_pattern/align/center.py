@@ -0,0 +1,236 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""implements the center star aligner"""
+
+from openclean_pattern.align.base import Aligner, map_groups, BACKEND_THREAD
+from openclean_pattern.align.needlemanwunsch import NeedlemanWunschAligner
+from openclean_pattern.collect.base import distinct_signatures, column_size
+from openclean_pattern.datatypes.base import SupportedDataTypes, GAP_TOKEN
+
+import numpy as np
+import os
+from typing import List, Optional, Tuple
+
+ALIGN_CENTER = "center"
+GAP = SupportedDataTypes.GAP
+
+CENTER_MEDOID = "medoid"
+CENTER_FREQUENT = "frequent"
+
+
+class CenterStarAligner(Aligner):
+    """
+    Center star multiple sequence alignment. A center row is picked from each group and every other row is aligned
+    to it with a pairwise Needleman-Wunsch alignment. The pairwise alignments are merged on the tokens of the center:
+    the gaps a row inserts in the center are inserted for all rows, so the rows keep their pairwise alignment to the
+    center.
+
+    Unlike the ProgressiveAligner, no all pairs distance matrix or guide tree is needed and the pairwise alignments
+    are independent of each other, so a group of n rows takes O(n * L^2) work that can be split over n_jobs workers.
+    Only the distinct token type signatures of a group are aligned.
+
+    Reference: http://www.cs.ucf.edu/~shzhang/Combio12/lec4.pdf
+    """
+
+    def __init__(
+        self, pairwise: Optional[NeedlemanWunschAligner] = None, center: str = CENTER_MEDOID, sample_size: int = 64,
+        n_jobs: Optional[int] = 1, backend: str = BACKEND_THREAD, random_state: int = 42
+    ):
+        """initializes the Center Star Aligner
+
+        Parameters
+        ----------
+        pairwise: NeedlemanWunschAligner
+            the aligner for the alignments to the center. Its distance is used to find the medoid
+        center: str (default: 'medoid')
+            'medoid' picks the signature with the lowest weighted distance to a sample of the signatures, 'frequent'
+            picks the most frequent signature
+        sample_size: int (default: 64)
+            the maximum no. of signatures the medoid is picked from
+        n_jobs: int (default: 1)
+            no. of workers for the pairwise alignments. -1 uses all cpus
+        backend: str (default: 'thread')
+            'thread' or 'process' pool
+        random_state: int (default: 42)
+            the seed of the sample
+        """
+        super(CenterStarAligner, self).__init__(ALIGN_CENTER)
+        if center not in [CENTER_MEDOID, CENTER_FREQUENT]:
+            raise ValueError('center: {} not found'.format(center))
+        self.pairwise = NeedlemanWunschAligner() if pairwise is None else pairwise
+        self.center = center
+        self.sample_size = sample_size
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        self.backend = backend
+        self.random_state = random_state
+
+    def find_center(self, rows: List, counts: np.array) -> int:
+        """returns the position of the center among the distinct rows. The medoid is picked from a sample of the
+        rows, drawn in proportion to their no. of rows, and minimizes the distance to the sample weighted by the
+        no. of rows
+
+        Parameters
+        ----------
+        rows: list
+            the distinct rows of the group
+        counts: numpy array
+            the no. of rows with each signature
+
+        Returns
+        -------
+            int
+        """
+        if self.center == CENTER_FREQUENT or len(rows) < 3:
+            return int(np.argmax(counts))
+
+        sample = np.arange(len(rows))
+        if len(rows) > self.sample_size:
+            rng = np.random.RandomState(self.random_state)
+            sample = rng.choice(len(rows), self.sample_size, replace=False, p=counts / counts.sum())
+
+        distances = np.zeros((len(sample), len(sample)))
+        for u in range(len(sample)):
+            for v in range(u + 1, len(sample)):
+                distances[u, v] = distances[v, u] = self.pairwise.distance(rows[sample[u]], rows[sample[v]])
+        return int(sample[np.argmin(distances @ counts[sample])])
+
+    def align_to_center(self, rows: List, center: Tuple) -> List[Tuple[List, List]]:
+        """aligns each row to the center and describes where its tokens go relative to the tokens of the center
+
+        Parameters
+        ----------
+        rows: list
+            the rows to align
+        center: tuple
+            the center row
+
+        Returns
+        -------
+            for each row, a list with the positions of the row tokens inserted before each center token (and after
+            the last one) and a list with the position of the row token aligned with each center token or None
+        """
+        placements = list()
+        for row in rows:
+            inserted = [[] for _ in range(len(center) + 1)]
+            matched = [None] * len(center)
+            p = q = 0
+            for c, r in zip(*self.pairwise.align([center, row])):
+                if c.regex_type == GAP:
+                    inserted[p].append(q)
+                elif r.regex_type == GAP:
+                    p += 1
+                    continue
+                else:
+                    matched[p] = q
+                    p += 1
+                q += 1
+            placements.append((inserted, matched))
+        return placements
+
+    def align_group(self, col: List) -> List[Tuple]:
+        """aligns the rows of a single group to the center of the group
+
+        Parameters
+        ----------
+        col: list[Tuple(Tokens)]
+            the rows of the group
+
+        Returns
+        -------
+            list of aligned rows
+        """
+        rows, inverse, counts = distinct_signatures(col)
+        if not rows:
+            return list()
+        c = self.find_center(rows, counts)
+        center = tuple(rows[c])
+
+        # split the pairwise alignments in chunks for the workers
+        others = [r for r in range(len(rows)) if r != c]
+        n_jobs = max(1, self.n_jobs or 1)
+        step = max(1, -(-len(others) // (4 * n_jobs)))
+        chunks = [([rows[r] for r in others[s:s + step]], center) for s in range(0, len(others), step)]
+        placements = dict()
+        for chunk, result in zip(
+            range(0, len(others), step), map_groups(self.align_to_center, chunks, self.n_jobs, self.backend)
+        ):
+            placements.update(zip(others[chunk:chunk + step], result))
+        placements[c] = ([[] for _ in range(len(center) + 1)], list(range(len(center))))
+
+        # no. of columns inserted before each center token, enough for all the rows
+        widths = [max(len(inserted[p]) for inserted, _ in placements.values()) for p in range(len(center) + 1)]
+        starts = np.cumsum([0] + [w + 1 for w in widths]).tolist()
+        size = starts[-1] - 1
+
+        # the column of each token of each distinct row
+        layouts = list()
+        for r in range(len(rows)):
+            inserted, matched = placements[r]
+            layout = [None] * len(rows[r])
+            for p in range(len(center) + 1):
+                for k, q in enumerate(inserted[p]):
+                    layout[q] = starts[p] + k
+                if p < len(center) and matched[p] is not None:
+                    layout[matched[p]] = starts[p] + widths[p]
+            layouts.append(layout)
+
+        aligned = list()
+        for row, r in zip(col, inverse):
+            out = [GAP_TOKEN] * size
+            for token, position in zip(row, layouts[r]):
+                out[position] = token
+            aligned.append(tuple(out))
+        return aligned
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the distances of the medoid sample and a pairwise alignment of each distinct signature to the
+        center
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows of the group
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        m, length = column_size(distinct_signatures(column)[0])
+        s = min(m, self.sample_size) if self.center == CENTER_MEDOID and m >= 3 else 0
+        return 8 * s * s + 8 * length * length, (s * (s - 1) / 2 + m) * length ** 2
+
+    def align(self, column, groups):
+        """Takes in the column and the groups and returns an aligned version of each group by adding Gap tokens to each row.
+        A list[Tuple(Tokens)] is returned with row indices that appeared together in the groups dict aligned to
+        the same no. of tokens per group
+
+        Parameters
+        ----------
+        column: list[Tuple(Tokens)]
+            The column to align
+        groups: dict
+            The dict of groups with group id as key and row indices as values
+
+        Returns
+        -------
+            list[Tuple(Tokens)]
+        """
+        aligned = [None] * len(column)
+        for cluster, idx in groups.items():
+            col = list()
+            for id in idx:
+                if not isinstance(id, int):
+                    raise KeyError("row indices should be int. found: {}".format(id))
+                col.append(column[id])
+
+            for c, id in zip(self.align_group(col), idx):
+                if aligned[id] is not None:
+                    raise KeyError("found duplicate aligned tokens({new} and {old}) for same row id: {id}".format(id=id, new=c, old=aligned[id]))
+                aligned[id] = c
+
+        return aligned
@@ -9,6 +9,8 @@
 
 from openclean_pattern.align.distance.base import Distance
 
+import numpy as np
+
 DISTANCE_ABSOLUTE = 'ABS'
 
 
@@ -35,3 +37,55 @@ class AbsoluteDistance(Distance):
             float
         """
         return abs(len(u) - len(v))
+
+    def pairwise(self, column):
+        """
+        Takes a column of n rows and computes the nxn matrix of all pairwise distances
+
+        Parameters
+        ----------
+        column: list[tuple[Tokens]]
+            the rows to compare
+
+        Return
+        -------
+            nxn numpy array
+        """
+        lengths = np.fromiter((len(row) for row in column), dtype=np.float64, count=len(column))
+        return np.abs(lengths[:, None] - lengths[None, :])
+
+    def cross(self, u_column, v_column):
+        """
+        Computes the matrix of distances between each row in u_column and each row in v_column
+
+        Parameters
+        ----------
+        u_column: list[tuple[Tokens]]
+            the rows of the matrix
+        v_column: list[tuple[Tokens]]
+            the columns of the matrix
+
+        Return
+        -------
+            len(u_column) x len(v_column) numpy array
+        """
+        u_lengths = np.fromiter((len(row) for row in u_column), dtype=np.float64, count=len(u_column))
+        v_lengths = np.fromiter((len(row) for row in v_column), dtype=np.float64, count=len(v_column))
+        return np.abs(u_lengths[:, None] - v_lengths[None, :])
+
+    def min_distance(self, u_len, v_len):
+        """
+        The distance only depends on the row lengths, so the bound is exact
+
+        Parameters
+        ----------
+        u_len: int
+            the no. of tokens in row 1
+        v_len: int
+            the no. of tokens in row 2
+
+        Return
+        -------
+            float
+        """
+        return abs(u_len - v_len)
@@ -9,6 +9,8 @@
 
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 
 class Distance(object, metaclass=ABCMeta):
     """Distances interface to use for alignment
@@ -39,4 +41,64 @@ class Distance(object, metaclass=ABCMeta):
         -------
             float
         """
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+    def pairwise(self, column):
+        """
+        Takes a column of n rows and computes the nxn matrix of all pairwise distances
+
+        Parameters
+        ----------
+        column: list[list[Tokens]]
+            the rows to compare
+
+        Return
+        -------
+            nxn numpy array
+        """
+        n = len(column)
+        distances = np.empty((n, n))
+        for u in range(n):
+            # compute only half of the distances
+            for v in range(u, n):
+                distances[u][v] = distances[v][u] = self.compute(column[u], column[v])
+        return distances
+
+    def cross(self, u_column, v_column):
+        """
+        Computes the matrix of distances between each row in u_column and each row in v_column
+
+        Parameters
+        ----------
+        u_column: list[list[Tokens]]
+            the rows of the matrix
+        v_column: list[list[Tokens]]
+            the columns of the matrix
+
+        Return
+        -------
+            len(u_column) x len(v_column) numpy array
+        """
+        distances = np.empty((len(u_column), len(v_column)))
+        for u, urow in enumerate(u_column):
+            for v, vrow in enumerate(v_column):
+                distances[u][v] = self.compute(urow, vrow)
+        return distances
+
+    def min_distance(self, u_len, v_len):
+        """
+        Returns a lower bound of the distance between any two rows with the given no. of tokens. Used
+        to skip comparisons. The bound must not decrease as the length difference grows.
+
+        Parameters
+        ----------
+        u_len: int
+            the no. of tokens in row 1
+        v_len: int
+            the no. of tokens in row 2
+
+        Return
+        -------
+            float
+        """
+        return 0
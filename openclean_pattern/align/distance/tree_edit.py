@@ -10,9 +10,16 @@
 from openclean_pattern.datatypes.base import SupportedDataTypes
 from openclean_pattern.align.distance.base import Distance
 
+import numpy as np
+
 
 DISTANCE_TED = 'TED'
 
+# token types that are considered equal to each other
+PUNCS = (SupportedDataTypes.SPACE_REP, SupportedDataTypes.PUNCTUATION)
+# token types that are equal to alphanums if the distance is not strict
+LOOSE = (SupportedDataTypes.ALPHA, SupportedDataTypes.DIGIT)
+
 
 class TreeEditDistance(Distance):
     """Takes in two rows of Tokens and calculates the distance between them"""
@@ -27,6 +34,34 @@ class TreeEditDistance(Distance):
         super(TreeEditDistance, self).__init__(DISTANCE_TED)
         self.strict = strict
 
+    def substitution(self, u_type: str, v_type: str) -> int:
+        """
+        Returns the cost (0 or 1) of aligning a token of type u_type with a token of type v_type
+
+        Parameters
+        ----------
+        u_type: str
+            the token type in row 1
+        v_type: str
+            the token type in row 2
+
+        Return
+        -------
+            int
+        """
+        # if they are of different types
+        if u_type != v_type:
+            # and both are not punctuation
+            if u_type in PUNCS and v_type in PUNCS:
+                return 0
+            # consider strictness
+            if not self.strict:
+                if (u_type in LOOSE and v_type == SupportedDataTypes.ALPHANUM) or \
+                        (v_type in LOOSE and u_type == SupportedDataTypes.ALPHANUM):
+                    return 0
+            return 1
+        return 0
+
     # distance b/w 2 rows:
     def compute(self, u, v):
         """
@@ -44,22 +79,10 @@ class TreeEditDistance(Distance):
             float
         """
         distance = 0
-        puncs = [SupportedDataTypes.SPACE_REP, SupportedDataTypes.PUNCTUATION]
 
         # zip same positioned tokens
         for ui, vi in zip(u, v):
-            # if they are of different types
-            if ui.regex_type != vi.regex_type:
-                # and both are not punctuation
-                if ui.regex_type in puncs and vi.regex_type in puncs:
-                    continue
-                # consider strictness
-                if not self.strict:
-                    if (ui.regex_type in [SupportedDataTypes.ALPHA, SupportedDataTypes.DIGIT] and vi.regex_type == SupportedDataTypes.ALPHANUM) or \
-                            (vi.regex_type in [SupportedDataTypes.ALPHA, SupportedDataTypes.DIGIT] and ui.regex_type == SupportedDataTypes.ALPHANUM):
-                        continue
-                # increment the distance
-                distance += 1
+            distance += self.substitution(ui.regex_type, vi.regex_type)
 
         # get the normalization denominator and add no. of gaps to the distance
         bigger = u if len(u) > len(v) else v
@@ -68,3 +91,139 @@ class TreeEditDistance(Distance):
 
         # return normalized distance
         return distance/len(bigger)
+
+    def min_distance(self, u_len: int, v_len: int) -> float:
+        """
+        Returns the lower bound of the distance between any two rows with the given no. of tokens
+
+        Parameters
+        ----------
+        u_len: int
+            the no. of tokens in row 1
+        v_len: int
+            the no. of tokens in row 2
+
+        Return
+        -------
+            float
+        """
+        bigger = max(u_len, v_len)
+        return abs(u_len - v_len) / bigger if bigger else 0
+
+    def _encode(self, column, types: dict, width: int):
+        """
+        Encodes the rows as an array of type codes padded with 0 to the given width. New types are added
+        to the types dict
+
+        Parameters
+        ----------
+        column: list[list[Tokens]]
+            the rows to encode
+        types: dict
+            the type codes
+        width: int
+            the no. of columns of the code array
+
+        Return
+        -------
+            tuple of the code array and the row lengths
+        """
+        codes = np.zeros((len(column), width), dtype=np.int32)
+        lengths = np.empty(len(column), dtype=np.int64)
+        for i, row in enumerate(column):
+            codes[i, :len(row)] = [types.setdefault(t.regex_type, len(types) + 1) for t in row]
+            lengths[i] = len(row)
+        return codes, lengths
+
+    def _cost_table(self, types: dict):
+        """
+        Returns the cost of each pair of type codes. A position where only one row is padded counts as a gap
+
+        Parameters
+        ----------
+        types: dict
+            the type codes
+
+        Return
+        -------
+            numpy array
+        """
+        cost = np.ones((len(types) + 1, len(types) + 1), dtype=np.int8)
+        cost[0, 0] = 0
+        for u_type, a in types.items():
+            for v_type, b in types.items():
+                cost[a, b] = self.substitution(u_type, v_type)
+        return cost
+
+    @staticmethod
+    def _normalize(counts, u_lengths, v_lengths):
+        """
+        Divides the no. of edits by the length of the bigger row
+        """
+        norm = np.maximum(u_lengths[:, None], v_lengths[None, :])
+        return np.divide(counts, norm, out=np.zeros(counts.shape), where=norm > 0)
+
+    def pairwise(self, column, block_size: int = 2 ** 24):
+        """
+        Takes a column of n rows and computes the nxn matrix of all pairwise distances. The rows are
+        encoded as padded arrays of type codes and compared in blocks of rows using numpy broadcasting.
+        The values are identical to the ones from compute.
+
+        Parameters
+        ----------
+        column: list[list[Tokens]]
+            the rows to compare
+        block_size: int (default: 2**24)
+            approximate no. of token comparisons per block. Bounds the temporary memory
+
+        Return
+        -------
+            nxn numpy array
+        """
+        n = len(column)
+        types = dict()
+        codes, lengths = self._encode(column, types, max((len(row) for row in column), default=0))
+        cost = self._cost_table(types)
+
+        distances = np.empty((n, n))
+        step = max(1, block_size // max(1, n * codes.shape[1]))
+        for start in range(0, n, step):
+            end = min(start + step, n)
+            # compute only the upper triangle and mirror it
+            block = cost[codes[start:end, None, :], codes[None, start:, :]].sum(axis=2, dtype=np.int64)
+            block = self._normalize(block, lengths[start:end], lengths[start:])
+            distances[start:end, start:] = block
+            distances[start:, start:end] = block.T
+        return distances
+
+    def cross(self, u_column, v_column, block_size: int = 2 ** 24):
+        """
+        Computes the matrix of distances between each row in u_column and each row in v_column the same way as
+        pairwise
+
+        Parameters
+        ----------
+        u_column: list[list[Tokens]]
+            the rows of the matrix
+        v_column: list[list[Tokens]]
+            the columns of the matrix
+        block_size: int (default: 2**24)
+            approximate no. of token comparisons per block. Bounds the temporary memory
+
+        Return
+        -------
+            len(u_column) x len(v_column) numpy array
+        """
+        width = max((len(row) for row in list(u_column) + list(v_column)), default=0)
+        types = dict()
+        u_codes, u_lengths = self._encode(u_column, types, width)
+        v_codes, v_lengths = self._encode(v_column, types, width)
+        cost = self._cost_table(types)
+
+        distances = np.empty((len(u_column), len(v_column)))
+        step = max(1, block_size // max(1, len(v_column) * width))
+        for start in range(0, len(u_column), step):
+            end = min(start + step, len(u_column))
+            block = cost[u_codes[start:end, None, :], v_codes[None, :, :]].sum(axis=2, dtype=np.int64)
+            distances[start:end] = self._normalize(block, u_lengths[start:end], v_lengths)
+        return distances
@@ -9,6 +9,8 @@
 
 from openclean_pattern.align.combinatorics import CombAligner, ALIGN_COMB
 from openclean_pattern.align.pad import ALIGN_PAD, Padder
+from openclean_pattern.align.smart import ALIGN_MSC, MSCAligner
+from openclean_pattern.align.center import ALIGN_CENTER, CenterStarAligner
 
 
 class AlignerFactory(object):
@@ -29,5 +31,9 @@ class AlignerFactory(object):
         #todo: fix combAligner
         elif aligner == ALIGN_COMB:
             return CombAligner()
+        elif aligner == ALIGN_MSC:
+            return MSCAligner()
+        elif aligner == ALIGN_CENTER:
+            return CenterStarAligner()
 
         raise ValueError('aligner: {} not found'.format(aligner))
@@ -14,12 +14,59 @@ from openclean_pattern.align.distance.factory import DistanceFactory, DISTANCE_T
 from openclean_pattern.align.base import Sequence, Alignment
 
 from collections import deque
-from itertools import product
-from typing import Iterable, List, Dict
+import numpy as np
+from typing import Iterable, List, Dict, Optional
 
 ALIGN_NEEDLEMANWUNSCH = "nw"
 GAP = SupportedDataTypes.GAP
 
+# score of the cells outside of the band
+NEG = np.iinfo(np.int64).min // 2
+
+
+def band_width(band: Optional[int], N: int, M: int) -> int:
+    """returns the half width of the band of an N x M table. The band always includes the length difference
+    and covers the whole table if band is None
+
+    Parameters
+    ----------
+    band: int
+        the configured half width
+    N: int
+        no. of rows
+    M: int
+        no. of columns
+
+    Returns
+    -------
+        int
+    """
+    if band is None:
+        return max(N, M)
+    return min(max(band, abs(N - M) + 1), max(N, M))
+
+
+def band_gaps(k: int, N: int, M: int) -> int:
+    """returns the no. of gaps a path of an N x M table needs to get back to the last cell after it reached a cell
+    more than k away from the diagonal, i.e. outside of a band of half width k. It needs at least as many gaps to
+    get there, so the score of any path that leaves the band is bounded and a banded result that beats the bound
+    is optimal
+
+    Parameters
+    ----------
+    k: int
+        the half width of the band
+    N: int
+        no. of rows
+    M: int
+        no. of columns
+
+    Returns
+    -------
+        int
+    """
+    return max(0, k + 1 - abs(N - M))
+
 
 class NeedlemanWunschAligner(Aligner):
     """
@@ -31,23 +78,108 @@ class NeedlemanWunschAligner(Aligner):
         https://upload.wikimedia.org/wikipedia/en/c/c4/ParallelNeedlemanAlgorithm.pdf
     """
 
-    def __init__(self, keep_gaps_together: bool = False):
+    def __init__(self, keep_gaps_together: bool = False, band: Optional[int] = None):
         """initialize the NW aligner
 
         Parameters
         ----------
         keep_gaps_together: bool
             flag to allow different configurations
+        band: int (default: None)
+            if set, only the cells within band of the diagonal are computed. The band is at least one wider than
+            the length difference of the sequences (band=0 derives it from the length difference alone) and is
+            doubled until no path leaving it can beat the banded score, so the result is that of the full table.
+            None computes the full table. Ignored if
+            keep_gaps_together, whose initialization rewards paths far from the diagonal
 
         """
         super(NeedlemanWunschAligner, self).__init__(ALIGN_NEEDLEMANWUNSCH)
         self.keep_gaps_together = keep_gaps_together
+        self.band = band
         self.dist = DistanceFactory.create(DISTANCE_TED)
         self.dist.strict = False
 
+    def _type_codes(self, x: Sequence, y: Sequence):
+        """encodes the tokens of x and y as type codes and returns the codes with the table of the type codes
+        that match each other
+
+        Parameters
+        ----------
+        x: Iterable
+            value 1
+        y: Iterable
+            value 2
+
+        Returns
+        -------
+            tuple of the codes of x, the codes of y and the boolean match table
+        """
+        types = dict()
+        x_codes = np.array([types.setdefault(t.regex_type, len(types)) for t in x], dtype=np.intp)
+        y_codes = np.array([types.setdefault(t.regex_type, len(types)) for t in y], dtype=np.intp)
+        matches = np.array(
+            [[self.dist.substitution(u, v) == 0 for v in types] for u in types], dtype=bool
+        ).reshape(len(types), len(types))
+        return x_codes, y_codes, matches
+
+    def _scores(self, matches: np.array) -> np.array:
+        """converts matches to match scores
+
+        Parameters
+        ----------
+        matches: numpy array
+            boolean array of matching token pairs
+
+        Returns
+        -------
+            numpy array of the same shape
+        """
+        # heuristic optimal costing for sequences
+        match, mismatch = (2, -3) if self.keep_gaps_together else (1, 0)
+        return np.where(matches, match, mismatch)
+
+    def _score_table(self, x: Sequence, y: Sequence) -> np.array:
+        """returns the match score of each pair of tokens of x and y. The tokens are encoded as type codes and
+        the scores are looked up in a substitution matrix of the distinct types
+
+        Parameters
+        ----------
+        x: Iterable
+            value 1
+        y: Iterable
+            value 2
+
+        Returns
+        -------
+            len(x) x len(y) numpy array
+        """
+        x_codes, y_codes, matches = self._type_codes(x, y)
+        return self._scores(matches[x_codes[:, None], y_codes[None, :]])
+
+    def _initialization(self, n: int) -> np.array:
+        """returns the scores of the first n cells of the initialized row or column after the corner
+
+        Parameters
+        ----------
+        n: int
+            no. of cells
+
+        Returns
+        -------
+            numpy array
+        """
+        # 2i keeps gaps together, -i/-j injects gaps inside strings
+        return 2 * np.arange(n) if self.keep_gaps_together else -np.arange(n)
+
     def _align(self, x: Sequence, y: Sequence):
         """aligns two Sequences
 
+        The score and pointer tables are numpy arrays with the score table shifted by one so that row and column 0
+        hold the initialization. Each row is computed at once: the diagonal and vertical moves only depend on the
+        previous row and the horizontal moves are resolved with a running maximum. With a band, only the cells
+        within the band of each row are computed. The band is doubled until the banded score beats the best score
+        of any path that leaves it, see band_gaps, so the alignment is the one of the full table.
+
         Parameters
         ----------
         x: Iterable
@@ -59,44 +191,185 @@ class NeedlemanWunschAligner(Aligner):
         -------
             aligned list of lists
         """
+        N, M = len(x), len(y)
+        S = self._score_table(x, y)
 
-        DIAG = -1, -1
-        LEFT = -1, 0
-        UP = 0, -1
+        k = band_width(None if self.keep_gaps_together else self.band, N, M)
+        while True:
+            score, Ptr = self._fill(S, k)
+            if k >= max(N, M) or self._beats_band(score, k, N, M):
+                return self._traceback(Ptr, N, M)
+            k = min(2 * k, max(N, M))
 
-        # Create tables F and Ptr and get costing
-        F = dict()
-        Ptr = {}
+    @staticmethod
+    def _beats_band(score: int, k: int, N: int, M: int) -> bool:
+        """checks if a banded score is higher than the score of any path that leaves the band. Such a path has at
+        least g = |N - M| + 2 * band_gaps gaps, the first of which is free in the initialization, and
+        (N + M - g) / 2 diagonal moves, so its score is at most (N + M - 3g + 2) / 2. Only holds for the match,
+        mismatch and gap scores of 1, 0 and -1
 
-        F[-1, -1] = 0
-        N, M = len(x), len(y)
+        Parameters
+        ----------
+        score: int
+            the score of the last cell of the banded table
+        k: int
+            the half width of the band
+        N: int
+            no. of rows
+        M: int
+            no. of columns
 
-        # 2i keeps gaps together, -i/-j injects gaps inside strings
-        for i in range(N):
-            F[i, -1] = -i if not self.keep_gaps_together else 2 * i
-        for j in range(M):
-            F[-1, j] = -j if not self.keep_gaps_together else 2 * j
+        Returns
+        -------
+            bool
+        """
+        gaps = abs(N - M) + 2 * band_gaps(k, N, M)
+        return 2 * score > N + M - 3 * gaps + 2
 
-        # heuristic optimal costing for sequences
-        _eval = (lambda a, b: int(self.dist.compute([a], [b]) == 0)) if not self.keep_gaps_together else (
-            lambda a, b: 2 if self.dist.compute([a], [b]) == 0 else -3)
+    def _fill(self, S: np.array, k: int) -> np.array:
+        """fills the score table within k of the diagonal and returns the score of the last cell and the pointer
+        table
 
-        option_Ptr = DIAG, LEFT, UP
-        for i, j in product(range(N), range(M)):
+        Parameters
+        ----------
+        S: numpy array
+            the match scores from _score_table
+        k: int
+            the half width of the band
+
+        Returns
+        -------
+            tuple of the score and the N x M numpy array of directions
+        """
+        N, M = S.shape
+
+        # Create tables F and Ptr
+        F = np.full((N + 1, M + 1), NEG, dtype=np.int64)
+        Ptr = np.zeros((N, M), dtype=np.int8)
+
+        F[0, 0] = 0
+        F[1:, 0] = self._initialization(N)
+        F[0, 1:] = self._initialization(M)
+
+        for i in range(N):
+            # the columns of the band in row i + 1 of F
+            lo, hi = max(1, i + 1 - k), min(M, i + 1 + k)
+            if lo > hi:
+                continue
+            cols = np.arange(hi - lo + 1)
             # no gap penatlies involved (or gap affines like in Gotoh's algorithm)
-            option_F = (
-                F[i - 1, j - 1] + _eval(x[i], y[j]),
-                F[i - 1, j] - 1,
-                F[i, j - 1] - 1,
-            )
-            F[i, j], Ptr[i, j] = max(zip(option_F, option_Ptr))
+            diag = F[i, lo - 1:hi] + S[i, lo - 1:hi]
+            left = F[i, lo:hi + 1] - 1
+            best = np.maximum(diag, left)
+            # F[i, j] = max(best[j], F[i, j - 1] - 1) for all j at once
+            row = np.maximum(np.maximum.accumulate(best + cols), F[i + 1, lo - 1] - 1) - cols
+            F[i + 1, lo:hi + 1] = row
+            up = F[i + 1, lo - 1:hi] - 1
+            # ties prefer UP, then LEFT, then DIAG
+            Ptr[i, lo - 1:hi] = np.where(up == row, 2, np.where(left == row, 1, 0))
+
+        return int(F[N, M]), Ptr
+
+    def distance(self, x: Sequence, y: Sequence) -> float:
+        """computes the non strict TreeEditDistance between x and y after aligning them, without building the
+        alignment. The distance of an aligned pair is the no. of mismatched tokens and gaps over the length of the
+        alignment, i.e. len(x) + len(y) - diagonal moves, so the DP keeps two rolling rows with the score, the
+        matches and the diagonal moves of the path each cell would trace back to. The ties are broken the same way
+        as in the traceback and the band is widened the same way, so the result equals the distance of the aligned
+        pair returned by align while the memory is linear in the length of y.
+
+        Parameters
+        ----------
+        x: Iterable
+            value 1
+        y: Iterable
+            value 2
+
+        Returns
+        -------
+            float
+        """
+        N, M = len(x), len(y)
+        if not N or not M:
+            return 1. if N or M else 0.
+
+        x_codes, y_codes, types = self._type_codes(x, y)
+        hits = types[x_codes[:, None], y_codes[None, :]].tolist()
+        k = band_width(None if self.keep_gaps_together else self.band, N, M)
+        while True:
+            score, matches, diagonals = self._fill_counts(hits, k)
+            if k >= max(N, M) or self._beats_band(score, k, N, M):
+                length = N + M - diagonals
+                return (length - matches) / length
+            k = min(2 * k, max(N, M))
+
+    def _fill_counts(self, hits: List[List[bool]], k: int):
+        """fills the score table within k of the diagonal one row at a time and returns the score and the no. of
+        matches and diagonal moves on the optimal path. Besides the scores, each row keeps the matches and the
+        diagonal moves of the path of each cell
+
+        Parameters
+        ----------
+        hits: list of list of bool
+            the matching token pairs
+        k: int
+            the half width of the band
+
+        Returns
+        -------
+            tuple of int, int, int
+        """
+        N, M = len(hits), len(hits[0])
+        match, mismatch = (2, -3) if self.keep_gaps_together else (1, 0)
+
+        F = [0] + self._initialization(M).tolist()
+        C, D = [0] * (M + 1), [0] * (M + 1)
+        for i, first in enumerate(self._initialization(N).tolist()):
+            f, c, d = [NEG] * (M + 1), [0] * (M + 1), [0] * (M + 1)
+            f[0] = first
+            hit = hits[i]
+            for j in range(max(1, i + 1 - k), min(M, i + 1 + k) + 1):
+                up, left = f[j - 1] - 1, F[j] - 1
+                diag = F[j - 1] + (match if hit[j - 1] else mismatch)
+                # ties prefer UP, then LEFT, then DIAG like the traceback
+                if up >= left and up >= diag:
+                    f[j], c[j], d[j] = up, c[j - 1], d[j - 1]
+                elif left >= diag:
+                    f[j], c[j], d[j] = left, C[j], D[j]
+                else:
+                    f[j], c[j], d[j] = diag, C[j - 1] + hit[j - 1], D[j - 1] + 1
+            F, C, D = f, c, d
+
+        return F[M], C[M], D[M]
+
+    @staticmethod
+    def _traceback(Ptr: np.array, N: int, M: int) -> List:
+        """follows the pointers from (N - 1, M - 1) back to the start
+
+        Parameters
+        ----------
+        Ptr: numpy array
+            the pointer table from _fill
+        N: int
+            length of x
+        M: int
+            length of y
+
+        Returns
+        -------
+            aligned list of lists
+        """
+        DIAG = -1, -1
+        LEFT = -1, 0
+        UP = 0, -1
+        directions = DIAG, LEFT, UP
 
         # Work backwards from (N - 1, M - 1) to (0, 0)
         # to find the best alignment.
         alignment = deque()
         i, j = N - 1, M - 1
         while i >= 0 and j >= 0:
-            direction = Ptr[i, j]
+            direction = directions[Ptr[i, j]]
             if direction == DIAG:
                 element = i, j
             elif direction == LEFT:
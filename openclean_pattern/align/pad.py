@@ -7,8 +7,10 @@
 
 """implements a naive padding aligner"""
 
-from openclean_pattern.datatypes.base import create_gap_token
-from openclean_pattern.align.base import Aligner
+from openclean_pattern.datatypes.base import GAP_TOKEN
+from openclean_pattern.align.base import Aligner, map_groups, BACKEND_THREAD
+
+from typing import List, Optional
 
 
 ALIGN_PAD = "pad"
@@ -18,9 +20,48 @@ class Padder(Aligner):
     """Aligns using the most frequent tokens and minimum set coverage
     """
 
-    def __init__(self):
-        """Initializes the Padder"""
+    def __init__(self, n_jobs: Optional[int] = 1, backend: str = BACKEND_THREAD):
+        """Initializes the Padder
+
+        Parameters
+        ----------
+        n_jobs: int (default: 1)
+            no. of workers to pad the groups with. -1 uses all cpus
+        backend: str (default: 'thread')
+            'thread' or 'process' pool
+        """
         super(Padder, self).__init__(ALIGN_PAD)
+        self.n_jobs = n_jobs
+        self.backend = backend
+
+    @staticmethod
+    def pad(col: List, idx: List) -> List:
+        """pads the rows of a single group with the shared gap token to the length of the longest one. Each short
+        row is extended once with a gap tuple of the missing length, the gap tuples are shared by all the rows and
+        the row indices are left to the caller
+
+        Parameters
+        ----------
+        col: list[Tuple(Tokens)]
+            the rows of the group
+        idx: list[int]
+            the row indices of the group
+
+        Returns
+        -------
+            list of padded rows
+        """
+        size = max((len(c) for c in col), default=0)
+        extensions = dict()
+        padded = list()
+        for c in col:
+            missing = size - len(c)
+            if missing:
+                if missing not in extensions:
+                    extensions[missing] = (GAP_TOKEN,) * missing
+                c = tuple(c) + extensions[missing]
+            padded.append(c)
+        return padded
 
     def align(self, column, groups):
         """Takes in the column and the groups and returns an aligned version of each group by adding Gap tokens to each row.
@@ -37,23 +78,19 @@ class Padder(Aligner):
         -------
             dict[int, Tuple(Tokens)]
         """
-        aligned = [None] * len(column)
+        args = list()
         for cluster, idx in groups.items():
-            #  pad the smaller ones with gap characters
             col = list()
-            size = 0
             for id in idx:
                 if not isinstance(id, int):
                     raise KeyError("row indices should be int. found: {}".format(id))
-
-                if len(column[id]) > size:
-                    size = len(column[id])
                 col.append(column[id])
+            args.append((col, idx))
 
-            for c, id in zip(col, idx):
-                while len(c) < size:
-                    c = (*c, create_gap_token(rowidx=id))
-
+        #  pad the smaller ones with gap characters
+        aligned = [None] * len(column)
+        for (_, idx), padded in zip(args, map_groups(self.pad, args, self.n_jobs, self.backend)):
+            for c, id in zip(padded, idx):
                 if aligned[id] is not None:
                     raise KeyError("found duplicate aligned tokens({new} and {old}) for same row id: {id}".format(id=id, new=c, old=aligned[id]))
                 aligned[id] = c
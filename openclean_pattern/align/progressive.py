@@ -7,20 +7,23 @@
 
 """implements the progressive aligner"""
 
-from openclean_pattern.align.base import Aligner, Sequence, Alignment
+from openclean_pattern.align.base import Aligner, Sequence, Alignment, map_groups, BACKEND_THREAD
 from openclean_pattern.datatypes.base import SupportedDataTypes, create_gap_token
 from openclean_pattern.datatypes.resolver import TypeResolver
 from openclean_pattern.collect.neighbor import NeighborJoin
+from openclean_pattern.collect.base import distinct_signatures, column_size, signature
 from openclean_pattern.align.distance.tree_edit import TreeEditDistance
-from openclean_pattern.align.needlemanwunsch import NeedlemanWunschAligner
+from openclean_pattern.align.needlemanwunsch import NeedlemanWunschAligner, band_width, band_gaps
 from openclean_pattern.utils.utils import list_contains_list
+from openclean.function.token.base import Token
 
 from collections import defaultdict, deque
-from itertools import product
-from typing import List, Dict, Union
+import numpy as np
+from typing import List, Dict, Optional, Tuple, Union
 
 ALIGN_PRO = "pro"
 GAP = SupportedDataTypes.GAP
+INF = float('inf')
 
 
 class ProgressiveAligner(Aligner):
@@ -40,7 +43,10 @@ class ProgressiveAligner(Aligner):
         Create Profiles of various positions
     """
 
-    def __init__(self, pairwise: Aligner = None, gap_penalty: float = 1, use_guide_tree: bool = True):
+    def __init__(
+        self, pairwise: Aligner = None, gap_penalty: float = 1, use_guide_tree: bool = True,
+        n_jobs: Optional[int] = 1, backend: str = BACKEND_THREAD, band: Optional[int] = None
+    ):
         """initializes the Progressive Aligner
 
         Parameters
@@ -51,17 +57,92 @@ class ProgressiveAligner(Aligner):
             controls the penalty term for introducing gaps
         use_guide_tree: bool
             flag to use Neearest Neighbor Joining clustering to compute sequence of the iteration
+        n_jobs: int (default: 1)
+            no. of workers to align the groups with. -1 uses all cpus
+        backend: str (default: 'thread')
+            'thread' or 'process' pool
+        band: int (default: None)
+            if set, only the cells within band of the diagonal are computed, in the merges and in the default
+            pairwise aligner. See NeedlemanWunschAligner
         """
         super(ProgressiveAligner, self).__init__(ALIGN_PRO)
-        self.pairwise = NeedlemanWunschAligner() if pairwise is None else pairwise
-        self.dist = lambda x, y: 0 if TreeEditDistance(strict=False).compute([x], [
-            y]) == 0 else 2 if x.regex_type is GAP or y.regex_type is GAP else 3
+        self.pairwise = NeedlemanWunschAligner(band=band) if pairwise is None else pairwise
+        self.distance = TreeEditDistance(strict=False)
 
         self.min_samples = 4
         self.eps = .5
 
         self.gap_penalty = gap_penalty
         self.use_guide_tree = use_guide_tree
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.band = band
+
+    def dist(self, x: Token, y: Token) -> int:
+        """the cost of aligning token x with token y, see _type_dist
+
+        Parameters
+        ----------
+        x: Token
+            the token in row 1
+        y: Token
+            the token in row 2
+
+        Returns
+        -------
+            int
+        """
+        return self._type_dist(x.regex_type, y.regex_type)
+
+    def _type_dist(self, u_type: str, v_type: str) -> int:
+        """the cost of aligning a token of type u_type with a token of type v_type: 0 if the types match, 2 if
+        either is a gap and 3 otherwise
+
+        Parameters
+        ----------
+        u_type: str
+            the token type in row 1
+        v_type: str
+            the token type in row 2
+
+        Returns
+        -------
+            int
+        """
+        if self.distance.substitution(u_type, v_type) == 0:
+            return 0
+        return 2 if u_type is GAP or v_type is GAP else 3
+
+    def _profile_cost(self, aln: Dict, seq: Dict) -> np.array:
+        """summarizes each position of the pairs of aln and seq as a vector of token type frequencies and returns the
+        total pair distance of all positions of seq to all positions of aln, i.e. the _pairwise_dist of each cell,
+        as a product of the profiles with the substitution table of the types. The cost doesn't depend on the no.
+        of rows of the alignments. The table is shifted by one so that row and column 0 are the gap positions -1.
+
+        Parameters
+        ----------
+        aln: dict
+            the pairs of the first alignment / sequence from _get_pairs
+        seq: dict
+            the pairs of the second alignment / sequence from _get_pairs
+
+        Returns
+        -------
+            (len(seq)) x (len(aln)) numpy array
+        """
+        types = dict()
+        codes = [
+            [[types.setdefault(t.regex_type, len(types)) for t in pairs[k]] for k in sorted(pairs)]
+            for pairs in (aln, seq)
+        ]
+        profiles = [
+            np.array([np.bincount(c, minlength=len(types)) for c in col], dtype=np.int64).reshape(len(col), len(types))
+            for col in codes
+        ]
+        table = np.array(
+            [[self._type_dist(u, v) for v in types] for u in types], dtype=np.int64
+        ).reshape(len(types), len(types))
+        return profiles[1] @ table @ profiles[0].T
 
     def _get_pairs(self, aln: List) -> Dict:
         """input list of alignments / sequences. e.g. ['w- 123 st----','w. 12- street']
@@ -117,7 +198,7 @@ class ProgressiveAligner(Aligner):
 
         return distance
 
-    def _init_matrix(self, aln: List, seq: List) -> Dict:
+    def _init_matrix(self, aln: List, seq: List, cost: Optional[np.array] = None) -> Dict:
         """takes the alignment and the sequences/alignments and returns the initialized F marix containing
         the pairwise similarities as starting indices
 
@@ -141,20 +222,25 @@ class ProgressiveAligner(Aligner):
             the rows of the pairwise init matrix
         seq: Sequence
             the columns of the pairwise init matrix
+        cost: numpy array (Optional)
+            the profile cost table of aln and seq from _profile_cost
 
         Returns
         -------
             an initialization matrix as a dictionary
         """
+        if cost is None:
+            cost = self._profile_cost(aln, seq)
+
         F = dict()
 
         for ci in aln:
             pre = 0 if ci == -1 else F[-1, ci - 1]
-            F[-1, ci] = (pre + self._pairwise_dist(aln[ci], seq[-1]))
+            F[-1, ci] = (pre + int(cost[0, ci + 1]))
 
         for ri in seq:
             pre = 0 if ri == -1 else F[ri - 1, -1]
-            F[ri, -1] = (pre + self._pairwise_dist(seq[ri], aln[-1]))
+            F[ri, -1] = (pre + int(cost[ri + 1, 0]))
 
         return F
 
@@ -311,26 +397,65 @@ class ProgressiveAligner(Aligner):
         LEFT = -1, 0
         UP = 0, -1
 
-        # Create tables F and Ptr and get costing
-        Ptr = {}
-
         aln = self._get_pairs(x)
         seq = self._get_pairs(y)
 
         N = len(aln) - 1
         M = len(seq) - 1
 
-        F = self._init_matrix(aln, seq)
+        cost = self._profile_cost(aln, seq)
+        init = self._init_matrix(aln, seq, cost)
+        cost = cost.tolist()
 
         option_Ptr = DIAG, LEFT, UP
 
-        for i, j in product(range(M), range(N)):
-            option_F = (
-                F[i - 1, j - 1] + self._pairwise_dist(aln[j], seq[i]),
-                F[i - 1, j] + self.gap_penalty,
-                F[i, j - 1] + self.gap_penalty,
-            )
-            F[i, j], Ptr[i, j] = min(zip(option_F, option_Ptr))
+        # only the cells within k of the diagonal are computed. A path that leaves the band needs band_gaps gaps
+        # inside the table to get back, so the band is widened until the banded cost is below their penalty
+        k = band_width(self.band, M, N)
+        while True:
+            # Create tables F and Ptr
+            F = dict(init)
+            Ptr = {}
+
+            for i in range(M):
+                for j in range(max(0, i - k), min(N, i + k + 1)):
+                    option_F = (
+                        F.get((i - 1, j - 1), INF) + cost[i + 1][j + 1],
+                        F.get((i - 1, j), INF) + self.gap_penalty,
+                        F.get((i, j - 1), INF) + self.gap_penalty,
+                    )
+                    F[i, j], Ptr[i, j] = min(zip(option_F, option_Ptr))
+
+            if k >= max(N, M) or F[M - 1, N - 1] < self.gap_penalty * band_gaps(k, M, N):
+                break
+            k = min(2 * k, max(N, M))
+
+        alignment = self._traceback(Ptr, N, M)
+
+        als = self._resolve_alignment(alignment, x, y)
+
+        return als
+
+    @staticmethod
+    def _traceback(Ptr: Dict, N: int, M: int) -> deque:
+        """follows the pointers from (M - 1, N - 1) back to the start
+
+        Parameters
+        ----------
+        Ptr: dict
+            the pointers of the computed cells
+        N: int
+            no. of positions of the first alignment
+        M: int
+            no. of positions of the second alignment
+
+        Returns
+        -------
+            the aligned pairs of positions with gaps
+        """
+        DIAG = -1, -1
+        LEFT = -1, 0
+        UP = 0, -1
 
         # Work backwards from (N - 1, M - 1) to (0, 0)
         # to find the best alignment.
@@ -354,12 +479,11 @@ class ProgressiveAligner(Aligner):
             alignment.appendleft((GAP, j))
             j -= 1
 
-        als = self._resolve_alignment(alignment, x, y)
-
-        return als
+        return alignment
 
     def _resolve_alignment(self, gap_info, x, y) -> Alignment:
-        """inserts gaps into input sequences/alignments as per the latest computation and merges them into a full alignment
+        """inserts gaps into input sequences/alignments as per the latest computation and merges them into a full alignment.
+        Each row is written into a preallocated buffer in a single pass over gap_info
 
         Parameters
         ----------
@@ -374,20 +498,97 @@ class ProgressiveAligner(Aligner):
         -------
             merged alignment with gaps of x and y
         """
-        for n, a in enumerate(gap_info):
-            j, i = a
-            if i is GAP:
-                x = x.insert_gap(n)
+        x_gaps = [i is GAP for _, i in gap_info]
+        y_gaps = [j is GAP for j, _ in gap_info]
+        return Alignment.from_tuple((self._fill_gaps(x, x_gaps), self._fill_gaps(y, y_gaps)))
+
+    @staticmethod
+    def _fill_gaps(component: Union[Sequence, Alignment], gaps: List[bool]) -> Union[Sequence, Alignment]:
+        """returns the component with its tokens in order at the positions that are not gaps and a gap token at
+        every other position
+
+        Parameters
+        ----------
+        component: Sequence/Alignment
+            the sequence or the rows of the alignment to fill
+        gaps: list[bool]
+            for each position of the output, if it is a gap
+
+        Returns
+        -------
+            the Sequence or Alignment with the gaps
+        """
+        rows = [component] if isinstance(component, Sequence) else component
+        filled = list()
+        for row in rows:
+            tokens = iter(row)
+            buffer = [None] * len(gaps)
+            for n, gap in enumerate(gaps):
+                buffer[n] = create_gap_token() if gap else next(tokens)
+            filled.append(Sequence(buffer))
+        return filled[0] if isinstance(component, Sequence) else Alignment(filled)
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the guide tree, a NeighborJoin of the group, and the profile alignments of the distinct
+        signatures, where each merge compares all the rows of both profiles at every cell of the dynamic
+        programming table
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows of the group
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        rows = distinct_signatures(column)[0]
+        m, length = column_size(rows)
+        memory, operations = NeighborJoin().estimate(rows) if self.use_guide_tree and m >= 3 else (0, 0)
+        return memory, operations + m * (m - 1) / 2 * length ** 2
+
+    def _expand(self, aligned: Alignment, rows: List, inverse: np.array, column: List) -> Alignment:
+        """expands the alignment of the distinct signatures of a group to all its rows. The aligned row of each
+        signature is the template of the gap layout of its rows and the rows are filled in the order of the group
+
+        Parameters
+        ----------
+        aligned: Alignment
+            the alignment of the distinct rows
+        rows: list
+            the distinct rows
+        inverse: numpy array
+            the position of the signature of each row of the column in rows
+        column: list
+            the rows of the group
 
-            if j is GAP:
-                y = y.insert_gap(n)
+        Returns
+        -------
+            Alignment of all the rows
+        """
+        if len(rows) == len(column):
+            return aligned
 
-        return Alignment.from_tuple((x, y))
+        # the aligned rows are told apart by the signature of their tokens, which is distinct by construction
+        position = {signature(row): r for r, row in enumerate(rows)}
+        templates = [None] * len(rows)
+        for seq in aligned:
+            tokens = [t for t in seq if t.regex_type != GAP]
+            templates[position[signature(tokens)]] = [t.regex_type == GAP for t in seq]
+
+        return Alignment([
+            self._fill_gaps(Sequence.from_tokens(row), templates[r]) for row, r in zip(column, inverse)
+        ])
 
     def align(self, column: List, groups: Dict) -> List[Alignment]:
         """Takes in the column and the groups and returns an aligned version of each group by adding Gap tokens to each row.
         A list[Tuple(Tokens)] is returned with the aligned values
 
+        Rows with the same token type signature always get the same gaps, so only the distinct signatures of each
+        group are aligned and each row gets the gaps of the aligned row of its signature. If a group has rows with
+        the same signature, its rows come out in the order of the group.
+        The groups are independent and are aligned in a thread or process pool if n_jobs > 1.
+
         Parameters
         ----------
         column: list[Tuple(Tokens)]
@@ -399,22 +600,35 @@ class ProgressiveAligner(Aligner):
         -------
             dict[Alignment]
         """
-        aligned = list()
+        cols = list()
         for cluster, idx in groups.items():
-            #  pad the smaller ones with gap characters
             col = list()
             for id in idx:
                 if not isinstance(id, int):
                     raise KeyError("row indices should be int. found: {}".format(id))
                 col.append(column[id])
+            cols.append((col,))
 
-            if not self.use_guide_tree or len(col) < 3:
-                aligned_cluster = self.align_column(col)
-            else:
-                nj = NeighborJoin()
-                tree, grps = nj.get_tree_and_order(col)
-                aligned_cluster = self.align_guide_tree(grps)
+        return map_groups(self.align_group, cols, self.n_jobs, self.backend)
 
-            aligned.append(aligned_cluster)
+    def align_group(self, col: List) -> Alignment:
+        """aligns the rows of a single group
 
-        return aligned
+        Parameters
+        ----------
+        col: list[Tuple(Tokens)]
+            the rows of the group
+
+        Returns
+        -------
+            Alignment
+        """
+        rows, inverse, _ = distinct_signatures(col)
+        if not self.use_guide_tree or len(rows) < 3:
+            aligned = self.align_column(rows)
+        else:
+            nj = NeighborJoin()
+            tree, grps = nj.get_tree_and_order(rows)
+            aligned = self.align_guide_tree(grps)
+
+        return self._expand(aligned, rows, inverse, col)
@@ -8,20 +8,164 @@
 """implements the smart aligner"""
 
 
-from openclean_pattern.align.base import Aligner
+from openclean_pattern.align.base import Aligner, map_groups, BACKEND_THREAD
+from openclean_pattern.datatypes.base import SupportedDataTypes, GAP_TOKEN
 
 from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 ALIGN_MSC = "msc"
 
+# token types that are never used as anchors
+NO_ANCHOR = (SupportedDataTypes.SPACE_REP, SupportedDataTypes.GAP)
+
 
 class MSCAligner(Aligner):
     """Aligns using the most frequent tokens and minimum set coverage
     """
-    def __init__(self):
+    def __init__(self, min_support: float = .1, n_jobs: Optional[int] = 1, backend: str = BACKEND_THREAD):
         """initializes the Minimum Set Coverage Aligner
+
+        Parameters
+        ----------
+        min_support: float (default: .1)
+            the minimum fraction of the rows of a group, and at least 2 rows, a token has to appear in to be an anchor
+        n_jobs: int (default: 1)
+            no. of workers to align the groups with. -1 uses all cpus
+        backend: str (default: 'thread')
+            'thread' or 'process' pool
         """
         super(MSCAligner, self).__init__(ALIGN_MSC)
+        self.min_support = min_support
+        self.n_jobs = n_jobs
+        self.backend = backend
+
+    def anchors(self, col: List) -> Tuple[List, List[Dict]]:
+        """finds the anchors of a group. Each token is keyed by its type, its lowercased value and the no. of
+        times the same token appeared before it in the row, so repeated separators are distinct anchors. The
+        rows of each key are kept in a bitset and the anchors are picked greedily, the key covering the most
+        uncovered rows first, until the frequent keys don't cover any more rows. The anchors are ordered by
+        their mean relative position in the rows and consecutive anchors that never appear in the same row, e.g.
+        'st' and 'ave', share a column
+
+        Parameters
+        ----------
+        col: list[Tuple(Tokens)]
+            the rows of the group
+
+        Returns
+        -------
+            the ordered anchor columns as lists of keys and, for each row, the position of each key in it
+        """
+        bitsets = defaultdict(int)
+        positions = list()
+        for r, row in enumerate(col):
+            seen = defaultdict(int)
+            pos = dict()
+            for p, token in enumerate(row):
+                if token.regex_type in NO_ANCHOR:
+                    continue
+                key = (token.regex_type, str(token).lower())
+                pos[key + (seen[key],)] = p
+                seen[key] += 1
+            for key in pos:
+                bitsets[key] |= 1 << r
+            positions.append(pos)
+
+        support = max(2, self.min_support * len(col))
+        candidates = {k: b for k, b in bitsets.items() if bin(b).count('1') >= support}
+
+        # greedy minimum set cover of the rows
+        chosen = list()
+        covered = 0
+        while candidates:
+            key = max(candidates, key=lambda k: bin(candidates[k] & ~covered).count('1'))
+            if not candidates[key] & ~covered:
+                break
+            chosen.append(key)
+            covered |= candidates.pop(key)
+
+        def mean_position(key):
+            rows = [r for r in range(len(col)) if key in positions[r]]
+            return sum(positions[r][key] / len(col[r]) for r in rows) / len(rows)
+
+        chosen.sort(key=mean_position)
+
+        columns, rows = list(), 0
+        for key in chosen:
+            if columns and not bitsets[key] & rows:
+                columns[-1].append(key)
+                rows |= bitsets[key]
+            else:
+                columns.append([key])
+                rows = bitsets[key]
+        return columns, positions
+
+    def align_group(self, col: List) -> List[Tuple]:
+        """aligns the rows of a single group on its anchors. The anchors and the segments between them get a column
+        range each, wide enough for the longest segment. A row that misses an anchor spreads the tokens around it
+        over the neighboring ranges. The tokens before the first anchor of a row are right aligned against it, all
+        other segments are left aligned. Rows without anchors are left aligned
+
+        Parameters
+        ----------
+        col: list[Tuple(Tokens)]
+            the rows of the group
+
+        Returns
+        -------
+            list of aligned rows
+        """
+        anchors, positions = self.anchors(col)
+        m = len(anchors)
+
+        # the anchors of each row in the anchor order, dropping the ones out of order
+        spans = list()
+        for row, pos in zip(col, positions):
+            kept, last = list(), -1
+            for a, keys in enumerate(anchors):
+                # the keys of a column never appear in the same row
+                p = next((pos[key] for key in keys if key in pos), -1)
+                if p > last:
+                    kept.append((a, p))
+                    last = p
+            # segment s lies between the anchors s - 1 and s. each region between two kept anchors is
+            # (first segment, last segment, tokens)
+            bounds = [(-1, -1)] + kept + [(m, len(row))]
+            regions = [(a + 1, b, row[p + 1:q]) for (a, p), (b, q) in zip(bounds[:-1], bounds[1:])]
+            spans.append((kept, regions))
+
+        # widen the segments until every region fits, the capacity of a region includes the missing anchors
+        widths = [0] * (m + 1)
+        for _, regions in spans:
+            for first, last, tokens in regions:
+                if first == last:
+                    widths[first] = max(widths[first], len(tokens))
+        for _, regions in spans:
+            for first, last, tokens in regions:
+                missing = len(tokens) - (sum(widths[first:last + 1]) + last - first)
+                if missing > 0:
+                    widths[first if first == 0 else last] += missing
+
+        offsets = [0]
+        for w in widths:
+            offsets.append(offsets[-1] + w + 1)
+        size = offsets[-1] - 1
+
+        aligned = list()
+        for row, (kept, regions) in zip(col, spans):
+            out = [None] * size
+            # anchor a is right after segment a
+            for a, p in kept:
+                out[offsets[a + 1] - 1] = row[p]
+            for first, last, tokens in regions:
+                start = offsets[first]
+                if first == 0 and last < m:
+                    # right align against the first anchor
+                    start = offsets[last + 1] - 1 - len(tokens)
+                out[start:start + len(tokens)] = tokens
+            aligned.append(tuple(GAP_TOKEN if t is None else t for t in out))
+        return aligned
 
     def align(self, column, groups):
         """ Looks at most frequent tokens at each position in the column, gets the minimum set coverage, and aligns
@@ -41,6 +185,8 @@ class MSCAligner(Aligner):
         Ave -> {4, 5}
         Jay -> {1}
 
+        The work is linear in the no. of tokens, plus a bitset operation per candidate anchor for each anchor picked.
+        The groups are independent and can be aligned by n_jobs workers.
 
         Parameters
         ----------
@@ -52,4 +198,21 @@ class MSCAligner(Aligner):
         -------
             list[Tuple(Tokens)]
         """
-        raise NotImplementedError()
+        args, indices = list(), list()
+        for cluster, idx in groups.items():
+            col = list()
+            for id in idx:
+                if not isinstance(id, int):
+                    raise KeyError("row indices should be int. found: {}".format(id))
+                col.append(column[id])
+            args.append((col,))
+            indices.append(idx)
+
+        aligned = [None] * len(column)
+        for idx, group in zip(indices, map_groups(self.align_group, args, self.n_jobs, self.backend)):
+            for c, id in zip(group, idx):
+                if aligned[id] is not None:
+                    raise KeyError("found duplicate aligned tokens({new} and {old}) for same row id: {id}".format(id=id, new=c, old=aligned[id]))
+                aligned[id] = c
+
+        return aligned
@@ -7,6 +7,9 @@
 
 
 from abc import ABCMeta, abstractmethod
+from typing import List, Tuple
+
+import numpy as np
 
 
 class Collector(metaclass=ABCMeta):
@@ -42,3 +45,76 @@ class Collector(metaclass=ABCMeta):
         """
         raise NotImplementedError()  # pragma: no cover
 
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the memory of the largest array and the no. of token operations needed to collect a column
+        before collecting it. By default, collectors are linear: a single pass over all the tokens.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        n, length = column_size(column)
+        return 0, n * length
+
+
+def column_size(column) -> Tuple[int, float]:
+    """returns the no. of rows of a tokenized column and their mean no. of tokens
+
+    Parameters
+    ----------
+    column: list of iterable[openclean.function.token.base.Token]
+        the tokenized rows
+
+    Returns
+    -------
+        tuple of int and float
+    """
+    n = len(column)
+    return n, sum(len(row) for row in column) / max(n, 1)
+
+
+def signature(row) -> Tuple[str, ...]:
+    """returns the token type signature of a tokenized row, i.e. the tuple of its token types
+
+    Parameters
+    ----------
+    row: iterable[openclean.function.token.base.Token]
+        the tokenized row
+
+    Returns
+    -------
+        tuple of str
+    """
+    return tuple(t.regex_type for t in row)
+
+
+def distinct_signatures(column) -> Tuple[List, np.array, np.array]:
+    """dedupes the rows of a column by their token type signature. Returns the first row with each distinct
+    signature (in order of appearance), the position of each row's signature in that list and the no. of rows
+    with each signature
+
+    Parameters
+    ----------
+    column: list of iterable[openclean.function.token.base.Token]
+        the column to dedupe
+
+    Returns
+    -------
+        tuple of list of rows, numpy array of len(column), numpy array of counts
+    """
+    index = dict()
+    rows = list()
+    inverse = np.empty(len(column), dtype=np.int64)
+    for i, row in enumerate(column):
+        sig = signature(row)
+        if sig not in index:
+            index[sig] = len(rows)
+            rows.append(row)
+        inverse[i] = index[sig]
+    counts = np.bincount(inverse, minlength=len(rows))
+    return rows, inverse, counts
@@ -0,0 +1,179 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""Collector class which groups tokens by length and clusters similar tokens inside each group"""
+
+from openclean_pattern.collect.base import Collector, distinct_signatures, column_size
+from openclean_pattern.collect.cluster import Cluster
+from openclean_pattern.align.distance.tree_edit import DISTANCE_TED
+
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import os
+
+from typing import Dict, List, Optional, Tuple
+
+COLLECT_BUCKET = "bucket"
+
+
+def _cluster_bucket(rows: List, dist: str, kwargs: Dict, max_size: Optional[int], random_state: int) -> np.array:
+    """clusters the rows of a single bucket and returns the DBSCAN label of each row. If there are more than
+    max_size rows, only a random sample of max_size rows is clustered and every other row gets the label of
+    its closest sampled row if that row is within eps, or -1 (noise) otherwise. Module level so that it can be
+    run in a process pool.
+
+    Parameters
+    ----------
+    rows: list of iterable[openclean.function.token.base.Token]
+        the rows of the bucket
+    dist: str
+        the distance to use
+    kwargs: dict
+        the arguments of the Cluster collector
+    max_size: int
+        the maximum no. of rows to cluster
+    random_state: int
+        the seed of the sample
+
+    Returns
+    -------
+        numpy array of labels
+    """
+    cluster = Cluster(dist=dist, **kwargs)
+    n = len(rows)
+    sample = np.arange(n)
+    if max_size is not None and n > max_size:
+        sample = np.sort(np.random.RandomState(random_state).choice(n, max_size, replace=False))
+
+    labels = np.full(n, -1, dtype=np.int64)
+    sample_rows = [rows[i] for i in sample]
+    for label, idx in cluster.collect(sample_rows).items():
+        labels[sample[idx]] = label
+
+    if len(sample) < n:
+        rest = np.setdiff1d(np.arange(n), sample)
+        step = max(1, 2 ** 20 // len(sample))
+        for start in range(0, len(rest), step):
+            block = rest[start:start + step]
+            distances = cluster.distance.cross([rows[i] for i in block], sample_rows)
+            nearest = distances.argmin(axis=1)
+            close = distances[np.arange(len(block)), nearest] <= cluster.eps
+            labels[block[close]] = labels[sample[nearest[close]]]
+    return labels
+
+
+class BucketCluster(Collector):
+    """This collector first splits the rows into buckets by their no. of tokens, like the Group collector, or by
+    bands of lengths. It then clusters the rows inside each bucket with the Cluster collector, so the quadratic
+    cost is bounded by the largest bucket instead of the whole column. Buckets larger than max_bucket_size are
+    subsampled and the buckets can be clustered in parallel.
+
+    The noise of all buckets is returned with the key -1, the clusters are numbered in order of the bucket lengths.
+    """
+    def __init__(
+        self, dist: str = DISTANCE_TED, band: int = 1, max_bucket_size: Optional[int] = 5000,
+        n_jobs: Optional[int] = 1, random_state: int = 42, **kwargs
+    ):
+        """intializes the collector object
+
+        Parameters
+        ----------
+        dist: str
+            the distance to use
+        band: int (default: 1)
+            the width of the length bands. 1 buckets rows with the same no. of tokens
+        max_bucket_size: int (default: 5000)
+            buckets with more rows are clustered on a random sample of this size. None disables sampling
+        n_jobs: int (default: 1)
+            no. of processes to cluster the buckets with. -1 uses all cpus
+        random_state: int (default: 42)
+            the seed of the samples
+        kwargs: dict
+            eps, min_samples and distinct for the Cluster collector. min_samples applies to the sample in
+            buckets that get subsampled
+        """
+        super(BucketCluster, self).__init__(COLLECT_BUCKET)
+        self.dist = dist
+        self.band = band
+        self.max_bucket_size = max_bucket_size
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        self.random_state = random_state
+        self.kwargs = kwargs
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the distance matrix of the largest bucket sample and, over all buckets, the distances of all
+        pairs of the sample and of the rows outside of the sample to the sample. If the Cluster collector is
+        distinct, the samples are bounded by the no. of distinct signatures of their buckets
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        buckets = defaultdict(list)
+        for row in column:
+            buckets[len(row) // self.band].append(row)
+
+        memory, operations = 0, 0
+        for rows in buckets.values():
+            n, length = column_size(rows)
+            m = n if self.max_bucket_size is None else min(n, self.max_bucket_size)
+            clustered = min(m, len(distinct_signatures(rows)[0])) if self.kwargs.get("distinct") else m
+            memory = max(memory, 8 * clustered * clustered)
+            operations += (clustered * (clustered - 1) / 2 + (n - m) * m) * length
+        return memory, operations
+
+    def collect(self, column):
+        """The collect method takes in a list of openclean.function.token.base.Token's, buckets them by length
+        and clusters each bucket.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the column to align
+
+        Returns
+        -------
+        a dict of lists with key 'n' representing the cluster and each inner
+        list representing row_indices of part of the cluster.
+        """
+        buckets = defaultdict(list)
+        for i, row in enumerate(column):
+            buckets[len(row) // self.band].append(i)
+        keys = sorted(buckets)
+
+        args = [
+            ([column[i] for i in buckets[k]], self.dist, self.kwargs, self.max_bucket_size, self.random_state)
+            for k in keys
+        ]
+        if self.n_jobs > 1 and len(keys) > 1:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                # submit the largest buckets first to balance the workers
+                futures = dict()
+                for b in sorted(range(len(keys)), key=lambda b: -len(buckets[keys[b]])):
+                    futures[b] = executor.submit(_cluster_bucket, *args[b])
+                labels = [futures[b].result() for b in range(len(keys))]
+        else:
+            labels = [_cluster_bucket(*a) for a in args]
+
+        # relabel the clusters of all buckets
+        groups = defaultdict()
+        offset = 0
+        for k, bucket_labels in zip(keys, labels):
+            for i, label in zip(buckets[k], bucket_labels):
+                n = -1 if label == -1 else offset + label
+                if n not in groups:
+                    groups[n] = list()
+                groups[n].append(i)
+            offset += max(bucket_labels.max() + 1, 0) if len(bucket_labels) else 0
+
+        return groups
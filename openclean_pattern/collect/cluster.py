@@ -7,7 +7,7 @@
 
 """Collector class which clusters similar tokens and returns the clusters"""
 
-from openclean_pattern.collect.base import Collector
+from openclean_pattern.collect.base import Collector, distinct_signatures, column_size
 from openclean_pattern.align.distance.factory import DistanceFactory
 from openclean_pattern.align.distance.tree_edit import DISTANCE_TED
 from openclean.function.token.base import Token
@@ -16,7 +16,7 @@ from collections import defaultdict
 from sklearn.cluster import DBSCAN
 import numpy as np
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 COLLECT_CLUSTER = "cluster"
 
@@ -25,11 +25,39 @@ class Cluster(Collector):
     """This collector creates groups based on the clustering of similarly distanced tokens"""
     def __init__(self, dist=DISTANCE_TED, **kwargs):
         """intializes the collector object
+
+        Parameters
+        ----------
+        dist: str
+            the distance to use
+        kwargs: dict
+            eps and min_samples for DBSCAN. If distinct is True, the rows are deduped by their token type signature
+            and only the distinct signatures are clustered, weighted by their no. of rows. Rows with the same
+            signature have a distance of 0, so the clusters are the same.
         """
         super(Cluster, self).__init__(COLLECT_CLUSTER)
         self.distance = DistanceFactory.create(dist)
         self.eps = kwargs.get("eps", .1)
         self.min_samples = kwargs.get("min_samples", 5)
+        self.distinct = kwargs.get("distinct", False)
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the nxn distance matrix and the distances of all pairs of rows, or of the distinct
+        signatures if distinct
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        if self.distinct:
+            column = distinct_signatures(column)[0]
+        n, length = column_size(column)
+        return 8 * n * n, n * (n - 1) / 2 * length
 
     def _precompute_distance(self, column: List[List[Token]]) -> np.array:
         """Accepts a n length column of tokens and generates a nxn matrix of all pairwise distances
@@ -42,13 +70,7 @@ class Cluster(Collector):
         -------
             nxn numpy array
         """
-        num_tokens = len(column)
-        distances = np.empty((num_tokens, num_tokens))
-        for u in range(num_tokens):
-            # compute only half of the distances
-            for v in range(u, num_tokens):
-                distances[u][v] = distances[v][u] = self.distance.compute(column[u], column[v])
-        return distances
+        return self.distance.pairwise(column)
 
     def collect(self, column):
         """The collect method takes in a list of openclean.function.token.base.Token's
@@ -67,16 +89,23 @@ class Cluster(Collector):
          list representing row_indices of groups with n tokens / row_index of
          part of the cluster.
         """
-        distances = self._precompute_distance(column)
-        clustering = DBSCAN(
+        dbscan = DBSCAN(
             metric="precomputed",
             n_jobs=-1,
             eps=self.eps,
             min_samples=self.min_samples
-        ).fit(distances)
+        )
+        if self.distinct:
+            rows, inverse, counts = distinct_signatures(column)
+            distances = self._precompute_distance(rows)
+            # expand the signature labels back to the rows
+            labels = dbscan.fit(distances, sample_weight=counts).labels_[inverse]
+        else:
+            distances = self._precompute_distance(column)
+            labels = dbscan.fit(distances).labels_
 
         groups = defaultdict()
-        for i, n in enumerate(clustering.labels_):
+        for i, n in enumerate(labels):
             if n not in groups:
                 groups[n] = list()
             groups[n].append(i)
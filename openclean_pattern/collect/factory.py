@@ -10,6 +10,11 @@
 from openclean_pattern.collect.group import Group, COLLECT_GROUP
 from openclean_pattern.collect.cluster import Cluster, COLLECT_CLUSTER
 from openclean_pattern.collect.neighbor import NeighborJoin, COLLECT_NEIGHBOR
+from openclean_pattern.collect.radius import RadiusCluster, COLLECT_RADIUS
+from openclean_pattern.collect.signature import SignatureGroup, COLLECT_SIGNATURE
+from openclean_pattern.collect.minhash import MinHashLSH, COLLECT_MINHASH
+from openclean_pattern.collect.bucket import BucketCluster, COLLECT_BUCKET
+from openclean_pattern.collect.online import OnlineCluster, COLLECT_ONLINE
 from openclean_pattern.collect.base import Collector
 
 
@@ -31,6 +36,16 @@ class CollectorFactory(object):
         elif collector == COLLECT_CLUSTER:
             return Cluster(**kwargs)
         elif collector == COLLECT_NEIGHBOR:
-            return NeighborJoin()
+            return NeighborJoin(**kwargs)
+        elif collector == COLLECT_RADIUS:
+            return RadiusCluster(**kwargs)
+        elif collector == COLLECT_SIGNATURE:
+            return SignatureGroup(**kwargs)
+        elif collector == COLLECT_MINHASH:
+            return MinHashLSH(**kwargs)
+        elif collector == COLLECT_BUCKET:
+            return BucketCluster(**kwargs)
+        elif collector == COLLECT_ONLINE:
+            return OnlineCluster(**kwargs)
 
         raise ValueError('collector: {} not found'.format(collector))
@@ -0,0 +1,158 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""Collector class which groups similar tokens using MinHash sketches and locality sensitive hashing"""
+
+from openclean_pattern.collect.base import Collector, distinct_signatures, signature
+
+from collections import defaultdict
+import numpy as np
+
+from typing import List
+
+COLLECT_MINHASH = "minhash"
+
+# mersenne prime for the universal hash functions
+PRIME = (1 << 31) - 1
+
+
+class MinHashLSH(Collector):
+    """This collector approximates the grouping of similar rows without computing all pairwise distances. Each
+    distinct token type signature is shingled into n-grams of token types and sketched with MinHash. The sketches
+    are split into bands and signatures that share all values of any band are candidate neighbors. Candidates whose
+    estimated Jaccard similarity reaches the threshold are merged into the same group.
+
+    More bands with fewer rows each find more of the similar pairs (recall), fewer and wider bands produce fewer
+    candidates (speed). The no. of permutations is bands * rows.
+
+    Reference: http://infolab.stanford.edu/~ullman/mmds/ch3.pdf
+    """
+    def __init__(
+        self, ngram: int = 2, bands: int = 16, rows: int = 4, threshold: float = .5, random_state: int = 42
+    ):
+        """intializes the collector object
+
+        Parameters
+        ----------
+        ngram: int (default: 2)
+            no. of consecutive token types per shingle
+        bands: int (default: 16)
+            no. of LSH bands
+        rows: int (default: 4)
+            no. of MinHash values per band
+        threshold: float (default: .5)
+            the minimum estimated Jaccard similarity of two candidate signatures to be merged
+        random_state: int (default: 42)
+            the seed for the hash functions
+        """
+        super(MinHashLSH, self).__init__(COLLECT_MINHASH)
+        self.ngram = ngram
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        rng = np.random.RandomState(random_state)
+        num_perm = bands * rows
+        self._a = rng.randint(1, PRIME, size=num_perm, dtype=np.int64)
+        self._b = rng.randint(0, PRIME, size=num_perm, dtype=np.int64)
+
+    def _shingles(self, sig, vocabulary: dict) -> np.array:
+        """returns the ids of the n-grams of the token types in the signature. The signature is padded with start
+        and end markers so that short rows and the row boundaries produce shingles as well.
+
+        Parameters
+        ----------
+        sig: tuple of str
+            the token type signature
+        vocabulary: dict
+            the ids of all shingles seen so far
+
+        Returns
+        -------
+            numpy array of shingle ids
+        """
+        padded = ('^',) + sig + ('$',)
+        n = min(self.ngram, len(padded))
+        # the ids are assigned in order of appearance so they don't depend on the hash seed
+        shingles = dict.fromkeys(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return np.fromiter(
+            (vocabulary.setdefault(s, len(vocabulary)) for s in shingles), dtype=np.int64, count=len(shingles)
+        )
+
+    def sketch(self, column: List) -> np.array:
+        """computes the MinHash sketch of each row
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the rows to sketch
+
+        Returns
+        -------
+            len(column) x (bands * rows) numpy array
+        """
+        vocabulary = dict()
+        sketches = np.empty((len(column), len(self._a)), dtype=np.int64)
+        for i, row in enumerate(column):
+            ids = self._shingles(signature(row), vocabulary)
+            sketches[i] = ((self._a[:, None] * ids[None, :] + self._b[:, None]) % PRIME).min(axis=1)
+        return sketches
+
+    def collect(self, column):
+        """The collect method takes in a list of openclean.function.token.base.Token's and groups the rows whose
+        signatures are connected by similar LSH candidates. Each bucket keeps a representative of every group of
+        signatures that fell into it, and a signature is compared with all of them, so it is merged with any group
+        of the bucket whose representative is similar enough. A signature that joined a group of the bucket isn't
+        added as a representative, which keeps the buckets short.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the column to align
+
+        Returns
+        -------
+        a dict of lists with key 'n' representing the group and each inner
+        list representing row_indices of part of the group.
+        """
+        rows, inverse, _ = distinct_signatures(column)
+        sketches = self.sketch(rows)
+
+        parent = list(range(len(rows)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for band in range(self.bands):
+            buckets = defaultdict(list)
+            cols = sketches[:, band * self.rows:(band + 1) * self.rows]
+            for i in range(len(rows)):
+                # compare with one representative of each group in the bucket
+                representatives = buckets[cols[i].tobytes()]
+                merged = False
+                for r in representatives:
+                    ri, rr = find(i), find(r)
+                    if ri == rr:
+                        merged = True
+                    elif np.mean(sketches[i] == sketches[r]) >= self.threshold:
+                        parent[max(ri, rr)] = min(ri, rr)
+                        merged = True
+                if not merged:
+                    representatives.append(i)
+
+        # relabel the components in order of first appearance
+        labels = dict()
+        groups = defaultdict()
+        for i, sig in enumerate(inverse):
+            n = labels.setdefault(find(sig), len(labels))
+            if n not in groups:
+                groups[n] = list()
+            groups[n].append(i)
+
+        return groups
@@ -7,14 +7,16 @@
 
 """Collector class which clusters similar tokens and returns the clusters"""
 
-from openclean_pattern.collect.base import Collector
+from openclean_pattern.collect.base import Collector, distinct_signatures, column_size
 from openclean_pattern.align.distance.factory import DistanceFactory
 from openclean_pattern.align.distance.tree_edit import DISTANCE_TED
 from openclean_pattern.align.base import Sequence
 from openclean_pattern.align.needlemanwunsch import NeedlemanWunschAligner
 from openclean.function.token.base import Token
 
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import os
 from skbio.tree import TreeNode
 from skbio.io.format.newick import _tokenize_newick, NewickFormatError
 from skbio import DistanceMatrix
@@ -177,15 +179,91 @@ def deserialize(st: str, words: Optional[List] = None, convert_underscores: bool
                             " missing its root.")
 
 
+def guide_order(tree: TreeNode, words: Optional[List] = None) -> Tuple[List, int]:
+    """extracts the nested list of operation order from a TreeNode whose tips are named by row indices in a
+    single post-order traversal. The result has the same form as the order returned by
+    deserialize(serialize(tree), words), e.g.:
+        ([['abc', ('aab','aac')],'xyz']], 0)
+    where an internal list represents an inner node of the tree.
+
+    Parameters
+    ----------
+    tree: TreeNode
+        the root of the tree, e.g. from skbio.tree.nj
+    words: list
+        If the tree was created using indices instead of labels, the original column can be passed in to return the
+        exact values inside the order array
+    """
+    values = dict()
+    for node in tree.postorder(include_self=True):
+        if node.children:
+            values[id(node)] = [values.pop(id(child)) for child in node.children]
+        elif node.name is None or node.name == '':
+            values[id(node)] = None
+        else:
+            values[id(node)] = Sequence(words[int(node.name)]) if words else int(node.name)
+    return [values[id(tree)]], 0
+
+
+def _align_distances(rows: List[List[Token]], start: int, end: int) -> Tuple[int, np.array]:
+    """computes the distances between the rows[start:end] and all following rows after aligning each pair with
+    the NeedlemanWunschAligner. Only the score of each alignment is computed, not the alignment itself. Module
+    level so that it can be run in a process pool.
+
+    Parameters
+    ----------
+    rows: list
+        input values
+    start: int
+        the first row of the block
+    end: int
+        the row after the last row of the block
+
+    Returns
+    -------
+        tuple of start and the (end - start) x len(rows) block of the upper triangle
+    """
+    pairwise = NeedlemanWunschAligner()
+    block = np.zeros((end - start, len(rows)))
+    for u in range(start, end):
+        for v in range(u, len(rows)):
+            block[u - start][v] = pairwise.distance(rows[u], rows[v])
+    return start, block
+
+
 class NeighborJoin(Collector):
     """This collector creates groups based on the clustering of similarly distanced tokens"""
 
-    def __init__(self):
+    def __init__(self, n_jobs: Optional[int] = 1):
         """intializes the collector object
+
+        Parameters
+        ----------
+        n_jobs: int (default: 1)
+            no. of processes to compute the pairwise distances with. -1 uses all cpus
         """
         super(NeighborJoin, self).__init__(COLLECT_NEIGHBOR)
         self.distance = DistanceFactory.create(DISTANCE_TED)
         self.distance.strict = False
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates a Needleman-Wunsch alignment of all pairs of the distinct signatures and the neighbor joining
+        of all the rows. The distances are expanded back to an n x n matrix of the rows, which neighbor joining
+        reduces in O(n^3)
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        n = len(column)
+        m, length = column_size(distinct_signatures(column)[0])
+        return 8 * (m * m + n * n), m * (m + 1) / 2 * length ** 2 + n ** 3
 
     def _compute_pairwise_distance(self, column: List[List[Token]]) -> np.array:
         """Computes the levenshtein distance between aligned elements in the column
@@ -199,6 +277,10 @@ class NeighborJoin(Collector):
         E, 6, 9, 6, 5, 0, 8
         F, 8,11, 8, 9, 8, 0
 
+        The alignments only depend on the token types, so each pair of distinct token type signatures is
+        aligned once. With n_jobs > 1, the upper triangle is split into blocks of rows with about the same
+        no. of pairs that are computed in a process pool.
+
         Parameters
         ----------
         column: list
@@ -209,16 +291,51 @@ class NeighborJoin(Collector):
             matrix of pairwise distances in the form above
 
         """
-        pairwise = NeedlemanWunschAligner()
-        l = len(column)
-        distances = np.empty((l, l))
-        for u in range(l):
-            # compute only half of the distances
-            for v in range(u, l):
-                au, av = pairwise.align([column[u], column[v]])  # get aligned
-                distances[u][v] = distances[v][u] = self.distance.compute(au, av)
+        rows, inverse, _ = distinct_signatures(column)
+        m = len(rows)
+        distances = np.zeros((m, m))
+
+        blocks = self._blocks(m)
+        if self.n_jobs > 1 and len(blocks) > 1:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                futures = [executor.submit(_align_distances, rows, start, end) for start, end in blocks]
+                results = [f.result() for f in futures]
+        else:
+            results = [_align_distances(rows, 0, m)]
+
+        for start, block in results:
+            distances[start:start + len(block)] = block
+        # mirror the upper triangle
+        distances = np.triu(distances) + np.triu(distances, 1).T
+
+        # expand the signatures back to the rows
+        return distances[np.ix_(inverse, inverse)]
 
-        return distances
+    def _blocks(self, m: int) -> List[Tuple[int, int]]:
+        """splits the rows of the upper triangle of a m x m matrix into blocks with about the same no. of cells
+
+        Parameters
+        ----------
+        m: int
+            the no. of rows
+
+        Returns
+        -------
+            list of (start, end) tuples
+        """
+        num_blocks = min(m, 4 * self.n_jobs)
+        if num_blocks <= 1:
+            return [(0, m)]
+        per_block = m * (m + 1) / 2 / num_blocks
+        blocks, start, cells = list(), 0, 0
+        for u in range(m):
+            cells += m - u
+            if cells >= per_block:
+                blocks.append((start, u + 1))
+                start, cells = u + 1, 0
+        if start < m:
+            blocks.append((start, m))
+        return blocks
 
     def get_tree_and_order(self, words: List[List[Token]]) -> Tuple[TreeNode, List]:
         """creates a nearest neighbor tree and returns a list of tuples in the form:
@@ -244,9 +361,7 @@ class NeighborJoin(Collector):
         dm = DistanceMatrix(distances, nw)
         tree = nj(dm)
 
-        tree, order = deserialize(serialize(tree), words)
-
-        return tree, order[0]
+        return tree, guide_order(tree, words)
 
     def collect(self, column: List[List[Token]]) -> Dict:
         """the collect method takes in a list of Tokens and collects the closest ones together. The returned
@@ -273,11 +388,9 @@ class NeighborJoin(Collector):
 
         # create the tree with the indices of the rows instead of the actual values
         nw = list()
-        [nw.append(i) for i in range(len(column))]
+        [nw.append(str(i)) for i in range(len(column))]
 
         dm = DistanceMatrix(distances, nw)
         tree = nj(dm)
 
-        _, order = deserialize(serialize(tree))
-
-        return {0: order[0]}
+        return {0: guide_order(tree)}
@@ -0,0 +1,338 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""Collector class which incrementally assigns streamed tokens to the closest cluster representative"""
+
+from openclean_pattern.collect.base import Collector, signature, column_size
+from openclean_pattern.align.distance.factory import DistanceFactory
+from openclean_pattern.align.distance.tree_edit import DISTANCE_TED
+from openclean.function.token.base import Token
+
+from collections import OrderedDict, defaultdict
+import numpy as np
+
+from typing import Dict, Iterable, List, Tuple
+
+COLLECT_ONLINE = "online"
+
+
+class Representative(object):
+    """The summary of a cluster of the OnlineCluster collector: the most frequent signatures of the cluster with an
+    example row each, their counts and the medoid row, the signature with the lowest weighted distance to the others.
+    """
+    def __init__(self, sig: tuple, row: List[Token]):
+        """intializes the representative of a new cluster with its first row
+
+        Parameters
+        ----------
+        sig: tuple of str
+            the token type signature of the row
+        row: list of Token
+            the first row of the cluster
+        """
+        self.signatures = {sig: 1}
+        self.examples = {sig: row}
+        self.medoid = row
+        self.size = 1
+
+    def add(self, sig: tuple, row: List[Token], count: int = 1, max_signatures: int = 16):
+        """counts the signature of a row in the cluster. If more than max_signatures signatures are tracked, the least
+        frequent one other than the medoid is forgotten.
+
+        Parameters
+        ----------
+        sig: tuple of str
+            the token type signature of the row
+        row: list of Token
+            the row
+        count: int
+            the no. of rows with the signature
+        max_signatures: int
+            the maximum no. of signatures to track
+        """
+        self.size += count
+        self.signatures[sig] = self.signatures.get(sig, 0) + count
+        self.examples.setdefault(sig, row)
+        if len(self.signatures) > max_signatures:
+            medoid = signature(self.medoid)
+            drop = min((s for s in self.signatures if s != medoid), key=self.signatures.get)
+            del self.signatures[drop]
+            del self.examples[drop]
+
+    def update_medoid(self, distance):
+        """recomputes the medoid of the tracked signatures
+
+        Parameters
+        ----------
+        distance: openclean_pattern.align.distance.base.Distance
+            the distance to use
+        """
+        sigs = list(self.signatures)
+        if len(sigs) == 1:
+            self.medoid = self.examples[sigs[0]]
+            return
+        weights = np.array([self.signatures[s] for s in sigs], dtype=float)
+        distances = distance.pairwise([self.examples[s] for s in sigs])
+        self.medoid = self.examples[sigs[int(np.argmin(distances @ weights))]]
+
+
+class OnlineCluster(Collector):
+    """This collector groups rows one at a time, so it can run continuously on an unbounded feed. Each cluster keeps a
+    Representative and each row is assigned to the cluster with the closest medoid if it is within eps, or else
+    starts a new cluster. The representatives are periodically consolidated: the medoids are recomputed, clusters
+    with medoids within eps are merged and, if there are more than max_clusters clusters, the smallest ones are
+    merged into their closest neighbors.
+
+    The work per row is bounded by max_clusters distances (and none for recently seen signatures) plus the
+    amortized consolidation, which is quadratic in max_clusters only. A row whose signature is among the cache_size
+    most recently seen ones joins the cluster of that signature. Evicted signatures are assigned by distance again,
+    so rows with the same signature can end up in different clusters if the clusters changed in between.
+
+    Merged clusters keep the label of the older one. Only the merges of the last consolidation are kept, so the
+    state stays bounded on an unbounded feed: use find to resolve a label returned since the previous consolidation.
+    """
+    def __init__(
+        self, dist: str = DISTANCE_TED, eps: float = .1, max_clusters: int = 64, max_signatures: int = 16,
+        consolidate_every: int = 1000, cache_size: int = 4096
+    ):
+        """intializes the collector object
+
+        Parameters
+        ----------
+        dist: str
+            the distance to use
+        eps: float (default: .1)
+            the maximum distance of a row to the medoid of its cluster
+        max_clusters: int (default: 64)
+            the maximum no. of clusters kept
+        max_signatures: int (default: 16)
+            the maximum no. of signatures tracked per cluster to pick the medoid from
+        consolidate_every: int (default: 1000)
+            no. of rows between two consolidations
+        cache_size: int (default: 4096)
+            no. of recently seen signatures whose cluster is remembered. Rows with these signatures skip the
+            distance computation
+        """
+        super(OnlineCluster, self).__init__(COLLECT_ONLINE)
+        self.distance = DistanceFactory.create(dist)
+        self.eps = eps
+        self.max_clusters = max_clusters
+        self.max_signatures = max_signatures
+        self.consolidate_every = consolidate_every
+        self.cache_size = cache_size
+        self.reset()
+
+    def reset(self):
+        """forgets all clusters"""
+        self.representatives = OrderedDict()  # type: Dict[int, Representative]
+        self.parent = dict()  # type: Dict[int, int]
+        self.seen = OrderedDict()
+        self.count = 0
+        self.consolidations = 0
+        self._next = 0
+
+    def find(self, label: int) -> int:
+        """returns the current label of a cluster that might have been merged in the last consolidation
+
+        Parameters
+        ----------
+        label: int
+            the label returned by add since the previous consolidation
+
+        Returns
+        -------
+            int
+        """
+        while self.parent.get(label, label) != label:
+            self.parent[label] = self.parent.get(self.parent[label], self.parent[label])
+            label = self.parent[label]
+        return label
+
+    def add(self, row: List[Token]) -> int:
+        """assigns a row to the closest cluster within eps or to a new cluster and returns its label
+
+        Parameters
+        ----------
+        row: list of Token
+            the tokenized row
+
+        Returns
+        -------
+            int
+        """
+        sig = signature(row)
+        label = self.seen.get(sig)
+        if label is not None:
+            label = self.find(label)
+            self.seen.move_to_end(sig)
+        elif self.representatives:
+            labels = list(self.representatives)
+            medoids = [self.representatives[k].medoid for k in labels]
+            distances = self.distance.cross([row], medoids)[0]
+            closest = int(np.argmin(distances))
+            if distances[closest] <= self.eps:
+                label = labels[closest]
+
+        consolidations = self.consolidations
+        if label is None:
+            if len(self.representatives) >= self.max_clusters:
+                self.consolidate(self.max_clusters - 1)
+            label = self._next
+            self._next += 1
+            self.representatives[label] = Representative(sig, row)
+        else:
+            self.representatives[label].add(sig, row, max_signatures=self.max_signatures)
+
+        self.seen[sig] = label
+        if len(self.seen) > self.cache_size:
+            self.seen.popitem(last=False)
+
+        self.count += 1
+        # a row triggers at most one consolidation, so find can resolve all the labels returned before it
+        if self.count % self.consolidate_every == 0 and consolidations == self.consolidations:
+            self.consolidate()
+        return label
+
+    def partial_fit(self, rows: Iterable[List[Token]]) -> List[int]:
+        """assigns each of the rows to a cluster
+
+        Parameters
+        ----------
+        rows: iterable of list of Token
+            the tokenized rows
+
+        Returns
+        -------
+            list of labels
+        """
+        return [self.add(row) for row in rows]
+
+    def consolidate(self, max_clusters: int = None):
+        """recomputes the medoids, merges the clusters with medoids within eps and then merges the smallest clusters
+        into their closest ones until at most max_clusters are left. Afterwards, the merges of the previous
+        consolidations are forgotten and the cached signatures point to the surviving labels
+
+        Parameters
+        ----------
+        max_clusters: int
+            the no. of clusters to keep. defaults to the max_clusters of the collector
+        """
+        max_clusters = max(1, self.max_clusters if max_clusters is None else max_clusters)
+        self.consolidations += 1
+        self.parent = dict()
+        for rep in self.representatives.values():
+            rep.update_medoid(self.distance)
+        if len(self.representatives) < 2:
+            return
+
+        labels = list(self.representatives)
+        distances = self.distance.pairwise([self.representatives[k].medoid for k in labels])
+        np.fill_diagonal(distances, np.inf)
+        alive = np.ones(len(labels), dtype=bool)
+
+        # merge close clusters, the older label survives
+        for i, j in zip(*np.nonzero(np.triu(distances <= self.eps))):
+            a, b = labels[i], labels[j]
+            if alive[i] and alive[j]:
+                self._merge(a, b)
+                alive[j] = False
+                distances[j, :] = distances[:, j] = np.inf
+
+        # merge the smallest clusters into their closest alive ones
+        while alive.sum() > max_clusters:
+            candidates = np.nonzero(alive)[0]
+            i = min(candidates, key=lambda c: self.representatives[labels[c]].size)
+            j = int(np.argmin(distances[i]))
+            a, b = (labels[i], labels[j]) if i < j else (labels[j], labels[i])
+            self._merge(a, b)
+            k = max(i, j)
+            alive[k] = False
+            distances[k, :] = distances[:, k] = np.inf
+
+        for rep in self.representatives.values():
+            rep.update_medoid(self.distance)
+
+        # point the merged labels and the cache directly to the surviving labels
+        self.parent = {label: self.find(label) for label in self.parent}
+        for sig, label in self.seen.items():
+            self.seen[sig] = self.parent.get(label, label)
+
+    def _merge(self, a: int, b: int):
+        """merges cluster b into cluster a
+
+        Parameters
+        ----------
+        a: int
+            the label of the surviving cluster
+        b: int
+            the label of the merged cluster
+        """
+        target, source = self.representatives[a], self.representatives.pop(b)
+        for sig, count in source.signatures.items():
+            target.add(sig, source.examples[sig], count=count, max_signatures=self.max_signatures)
+        # rows of forgotten signatures still count towards the size
+        target.size += source.size - sum(source.signatures.values())
+        self.parent[b] = a
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the distances of each row to at most max_clusters medoids
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        n, length = column_size(column)
+        return 8 * self.max_clusters ** 2, n * self.max_clusters * length
+
+    def collect(self, column):
+        """The collect method takes in a list of openclean.function.token.base.Token's and streams them through a
+        fresh set of clusters, consolidated after the last row.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the column to align
+
+        Returns
+        -------
+        a dict of lists with key 'n' representing the cluster and each inner
+        list representing row_indices of part of the cluster.
+        """
+        self.reset()
+        members = dict()
+        consolidations = self.consolidations
+        for i, row in enumerate(column):
+            members.setdefault(self.add(row), list()).append(i)
+            if self.consolidations != consolidations:
+                self._fold(members)
+                consolidations = self.consolidations
+        self.consolidate()
+        self._fold(members)
+
+        # relabel the clusters in order of first appearance
+        groups = defaultdict()
+        for n, idx in enumerate(sorted(members.values(), key=lambda idx: idx[0])):
+            groups[n] = sorted(idx)
+
+        return groups
+
+    def _fold(self, members: Dict[int, List[int]]):
+        """moves the rows of the clusters merged in the last consolidation to the surviving clusters
+
+        Parameters
+        ----------
+        members: dict
+            the row indices of each label
+        """
+        for label, root in self.parent.items():
+            if label in members:
+                members.setdefault(root, list()).extend(members.pop(label))
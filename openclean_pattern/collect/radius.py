@@ -0,0 +1,154 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""Collector class which clusters similar tokens using a sparse graph of close neighbors and returns the clusters"""
+
+from openclean_pattern.collect.base import distinct_signatures
+from openclean_pattern.collect.cluster import Cluster
+from openclean_pattern.align.distance.tree_edit import DISTANCE_TED
+from openclean.function.token.base import Token
+
+from collections import Counter, defaultdict
+from scipy.sparse import csr_matrix
+from sklearn.cluster import DBSCAN
+import numpy as np
+
+from typing import Iterator, List, Tuple
+
+COLLECT_RADIUS = "radius"
+
+
+class RadiusCluster(Cluster):
+    """This collector creates the same kind of groups as the Cluster collector without the dense nxn distance
+    matrix. Rows are deduped by their token type signature and only the pairs of distinct signatures that are
+    within eps of each other are stored in a sparse matrix. Signatures whose lengths alone put them further
+    than eps apart are never compared. The memory grows with the no. of close pairs instead of n^2.
+    """
+    def __init__(self, dist=DISTANCE_TED, **kwargs):
+        """intializes the collector object
+
+        Parameters
+        ----------
+        dist: str
+            the distance to use
+        kwargs: dict
+            eps and min_samples for DBSCAN and block_size, the approximate no. of distances computed at once
+        """
+        super(RadiusCluster, self).__init__(dist=dist, **kwargs)
+        self.collector_type = COLLECT_RADIUS
+        self.block_size = kwargs.get("block_size", 2 ** 20)
+
+    def estimate(self, column) -> Tuple[int, float]:
+        """estimates the largest block of distances and the distances between the distinct signatures of the
+        length buckets that are compared. The sparse matrix of close pairs isn't included
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the memory in bytes and the no. of token operations
+        """
+        buckets = Counter(len(row) for row in distinct_signatures(column)[0])
+        memory, operations = 0, 0
+        for u_len, v_len in self._compared_lengths(sorted(buckets)):
+            u, v = buckets[u_len], buckets[v_len]
+            memory = max(memory, 8 * min(u * v, max(self.block_size, v)))
+            operations += u * v * v_len
+        return memory, operations
+
+    def _compared_lengths(self, lengths: List[int]) -> Iterator[Tuple[int, int]]:
+        """yields the pairs of row lengths, shorter first, that aren't further than eps apart by their lengths alone
+
+        Parameters
+        ----------
+        lengths: list of int
+            the sorted distinct row lengths
+
+        Returns
+        -------
+            iterator of tuples of int
+        """
+        for a, u_len in enumerate(lengths):
+            for v_len in lengths[a:]:
+                # the lower bound only grows with the length difference
+                if self.distance.min_distance(u_len, v_len) > self.eps:
+                    break
+                yield u_len, v_len
+
+    def _neighbors(self, rows: List[List[Token]]) -> csr_matrix:
+        """Accepts a list of rows and generates a sparse matrix with the distances of all pairs of rows within eps
+
+         Parameters
+         ----------
+            rows: list[list(Token)]
+
+        Returns
+        -------
+            sparse nxn matrix
+        """
+        buckets = defaultdict(list)
+        for i, row in enumerate(rows):
+            buckets[len(row)].append(i)
+        lengths = sorted(buckets)
+
+        src, dst, data = list(), list(), list()
+        for u_len, v_len in self._compared_lengths(lengths):
+            u_idx, v_idx = buckets[u_len], buckets[v_len]
+            v_rows = [rows[j] for j in v_idx]
+            step = max(1, self.block_size // len(v_idx))
+            for start in range(0, len(u_idx), step):
+                block = u_idx[start:start + step]
+                distances = self.distance.cross([rows[i] for i in block], v_rows)
+                ui, vi = np.nonzero(distances <= self.eps)
+                u, v = np.asarray(block)[ui], np.asarray(v_idx)[vi]
+                src.append(u)
+                dst.append(v)
+                data.append(distances[ui, vi])
+                if u_len != v_len:
+                    # mirror the pairs from the other bucket
+                    src.append(v)
+                    dst.append(u)
+                    data.append(distances[ui, vi])
+
+        n = len(rows)
+        if not data:
+            return csr_matrix((n, n))
+        # explicit zeros are kept as neighbors
+        return csr_matrix((np.concatenate(data), (np.concatenate(src), np.concatenate(dst))), shape=(n, n))
+
+    def collect(self, column):
+        """The collect method takes in a list of openclean.function.token.base.Token's
+        and clusters them using DBSCAN on the sparse neighbor graph of their distinct signatures.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the column to align
+
+        Returns
+        -------
+         a dict of lists with key 'n' representing the cluster and each inner
+         list representing row_indices of part of the cluster.
+        """
+        rows, inverse, counts = distinct_signatures(column)
+        clustering = DBSCAN(
+            metric="precomputed",
+            n_jobs=-1,
+            eps=self.eps,
+            min_samples=self.min_samples
+        ).fit(self._neighbors(rows), sample_weight=counts)
+
+        groups = defaultdict()
+        for i, n in enumerate(clustering.labels_[inverse]):
+            if n not in groups:
+                groups[n] = list()
+            groups[n].append(i)
+
+        return groups
@@ -0,0 +1,125 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""Collector class which groups tokens by their token type signature and returns the groups"""
+
+from openclean_pattern.collect.base import Collector, signature
+from openclean_pattern.align.distance.tree_edit import LOOSE, PUNCS
+from openclean_pattern.datatypes.base import SupportedDataTypes
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+COLLECT_SIGNATURE = "signature"
+
+
+class SignatureGroup(Collector):
+    """This collector creates groups of rows with the same sequence of token types in a single hashing pass over
+    the column. Optionally, signatures that only differ in alphas or digits versus alphanums or in spaces versus
+    punctuation at the same positions are merged, which are the rows with a distance of 0 in the non-strict
+    TreeEditDistance. ALPHA and DIGIT signatures are not equal to each other and only merge through an ALPHANUM
+    signature, see _merge.
+    """
+    def __init__(self, strict: bool = True):
+        """intializes the collector object
+
+        Parameters
+        ----------
+        strict: bool (default: True)
+            if False, signatures with ALPHA or DIGIT tokens where another signature has ALPHANUM tokens and with
+            SPACE_REP tokens where another one has PUNCTUATION tokens are merged
+        """
+        super(SignatureGroup, self).__init__(COLLECT_SIGNATURE)
+        self.strict = strict
+
+    def collect(self, column):
+        """The collect method takes in a list of openclean.function.token.base.Token's and groups the rows with
+        the same token type signature.
+
+        Parameters
+        ----------
+        column: list of iterable[openclean.function.token.base.Token]
+            the column to align
+
+        Returns
+        -------
+        a dict of lists with key 'n' representing the group and each inner
+        list representing row_indices of part of the group.
+        """
+        signatures = dict()
+        for i, row in enumerate(column):
+            sig = signature(row)
+            if sig not in signatures:
+                signatures[sig] = list()
+            signatures[sig].append(i)
+
+        if self.strict:
+            clusters = [[idx] for idx in signatures.values()]
+        else:
+            clusters = self._merge(signatures)
+
+        groups = defaultdict()
+        for n, cluster in enumerate(clusters):
+            groups[n] = cluster[0] if len(cluster) == 1 else sorted(i for idx in cluster for i in idx)
+        return groups
+
+    def _merge(self, signatures: Dict[Tuple[str, ...], List[int]]) -> List[List[List[int]]]:
+        """merges the row indices of signatures that have a distance of 0 in the non-strict TreeEditDistance in a
+        single pass. Signatures that only differ in spaces versus punctuation are merged directly. Otherwise, a
+        signature is merged with the signatures that differ from it at a single position where one of them has
+        an ALPHANUM and the other an ALPHA or DIGIT token, so ALPHA and DIGIT signatures merge through an ALPHANUM
+        signature. Merges are transitive, but two signatures that differ at several positions are only merged
+        through such single position steps.
+
+        Parameters
+        ----------
+        signatures: dict
+            the row indices of each signature in order of first appearance
+
+        Returns
+        -------
+            list of the merged row index lists in order of first appearance
+        """
+        keys = list(signatures)
+        parent = list(range(len(keys)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        def union(a, b):
+            ra, rb = find(a), find(b)
+            # keep the root with the first appearance
+            parent[max(ra, rb)] = min(ra, rb)
+
+        # spaces and punctuation are always equal
+        folded = dict()
+        for k, sig in enumerate(keys):
+            key = tuple(SupportedDataTypes.PUNCTUATION if t in PUNCS else t for t in sig)
+            if key in folded:
+                union(folded[key], k)
+            else:
+                folded[key] = k
+
+        # the signatures with the same types at all other positions, with the alphanum one first
+        neighbors = defaultdict(list)
+        for key, k in folded.items():
+            for p, t in enumerate(key):
+                if t in LOOSE or t == SupportedDataTypes.ALPHANUM:
+                    neighbors[p, key[:p] + key[p + 1:]].append((t != SupportedDataTypes.ALPHANUM, k))
+        for candidates in neighbors.values():
+            loose, anchor = min(candidates)
+            if not loose:
+                for _, k in candidates:
+                    union(anchor, k)
+
+        merged = defaultdict(list)
+        for k, sig in enumerate(keys):
+            merged[find(k)].append(signatures[sig])
+        return list(merged.values())
@@ -57,3 +57,28 @@ class SupportedDataTypes:
     ADMIN_LEVEL_3 = 'ADMIN_3'
     ADMIN_LEVEL_4 = 'ADMIN_4'
     ADMIN_LEVEL_5 = 'ADMIN_5'
+
+
+class GapToken(TT.Token):
+    """An immutable gap Token without a row id. A single instance, GAP_TOKEN, is shared by all the rows that
+    are padded with it, the row index of a padded row is tracked outside of its tokens.
+    """
+    def __new__(cls):
+        return TT.Token.__new__(cls, '')
+
+    def __init__(self):
+        object.__setattr__(self, 'token_type', SupportedDataTypes.GAP)
+        object.__setattr__(self, 'rowidx', None)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("the shared gap token is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError("the shared gap token is immutable")
+
+    def __reduce__(self):
+        # unpickles to the shared instance
+        return 'GAP_TOKEN'
+
+
+GAP_TOKEN = GapToken()
@@ -9,7 +9,9 @@
 """
 
 from abc import abstractmethod, ABCMeta
-from typing import Iterable, List, Optional, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set, Tuple
 
 import datamart_geo
 import pandas as pd
@@ -19,6 +21,7 @@ import sqlite3
 from openclean.data.refdata import RefStore
 from openclean_pattern.tokenize.prefix_tree import PrefixTree
 from openclean_pattern.datatypes.base import SupportedDataTypes
+from openclean_pattern.utils.utils import StringComparator
 from openclean.function.token.base import Token, TokenTransformer
 
 import openclean.function.token.base as TT
@@ -103,13 +106,23 @@ class DefaultTypeResolver(TypeResolver):
     county called March County would be identified as (_MONTH_, _ALPHA_ ) instead of ( _COUNTY_ )
     """
 
-    def __init__(self, interceptors=None):
+    def __init__(
+        self, interceptors=None, adaptive: Optional[bool] = False, sample_size: Optional[int] = 100,
+        min_hit_rate: Optional[float] = 0.01
+    ):
         """ Initializes the DefaultTypeResolver.
 
         Parameters
         ----------
         interceptors: List[TypeResolver]
             the type resolvers for non-basic resolution
+        adaptive: bool (default: False)
+            if True, the tokenizer probes each interceptor on a sample of the column using the adapt method
+            and skips the interceptors that rarely find a match for the rest of the column
+        sample_size: int (default: 100)
+            no. of rows to probe the interceptors on in adaptive mode
+        min_hit_rate: float (default: 0.01)
+            the minimum proportion of sampled rows an interceptor needs to find a match in to be kept
         """
         if interceptors is None:
             interceptors = []
@@ -122,6 +135,56 @@ class DefaultTypeResolver(TypeResolver):
 
         interceptors.append(BasicTypeResolver())
         self.interceptors = interceptors
+        self.adaptive = adaptive
+        self.sample_size = sample_size
+        self.min_hit_rate = min_hit_rate
+        # the interceptors used to resolve rows. Changed by adapt.
+        self.active = interceptors
+        self.hit_rates = dict()
+
+    @property
+    def kept(self) -> List[TypeResolver]:
+        """the non-basic interceptors that are currently used to resolve rows.
+
+        Returns
+        -------
+        list of TypeResolver
+        """
+        return self.active[:-1]
+
+    def adapt(self, rows: List[List[Token]]) -> List[TypeResolver]:
+        """probes each non-basic interceptor on the sampled rows of unresolved tokens and only keeps the
+        interceptors that find a match in at least min_hit_rate of the rows. The hit rates are stored in
+        self.hit_rates by interceptor position.
+
+        Parameters
+        ----------
+        rows: list of list of openclean.function.token.base.Token
+            the sampled rows of a column
+
+        Returns
+        -------
+        list of the kept TypeResolvers
+        """
+        kept = list()
+        for i, mw in enumerate(self.interceptors[:-1]):
+            hits = 0
+            for row in rows:
+                # resolve a copy as interceptors may modify the tokens
+                probe = [Token(value=t, token_type=t.regex_type, rowidx=t.rowidx) for t in row]
+                if any(t.regex_type != TT.ANY for t in mw.resolve(probe)):
+                    hits += 1
+            self.hit_rates[i] = hits / len(rows) if rows else 0
+            if self.hit_rates[i] >= self.min_hit_rate:
+                kept.append(mw)
+
+        self.active = kept + self.interceptors[-1:]
+        return kept
+
+    def reset(self):
+        """resets the adaptive selection and uses all interceptors again."""
+        self.active = self.interceptors
+        self.hit_rates = dict()
 
     def resolve(self, tokens: List[Token]) -> List[Token]:
         """passes through all the middlewares and adding found non-basic types and finally through the
@@ -136,11 +199,102 @@ class DefaultTypeResolver(TypeResolver):
         -------
         list of openclean.function.token.base.Token
         """
-        for mw in self.interceptors:
+        for mw in self.active:
             tokens = mw.resolve(tokens)
         return tokens
 
 
+class FusedTypeResolver(DefaultTypeResolver):
+    """ Resolves the same types as the DefaultTypeResolver but in a single walk over each row instead of one
+    pass (and one new token list) per interceptor. The interceptors have to be AdvancedTypeResolvers.
+
+    The interceptor priorities are preserved: a lower priority interceptor only sees the tokens between the
+    matches of the higher priority ones, e.g. with DateResolver before GeoSpatialResolver, 'March County'
+    still resolves to (_MONTH_, _ALPHA_ ). Tokens that match no interceptor fall through to the basic types.
+    """
+
+    def __init__(self, interceptors=None, **kwargs):
+        """ Initializes the FusedTypeResolver.
+
+        Parameters
+        ----------
+        interceptors: List[AdvancedTypeResolver]
+            the type resolvers for non-basic resolution
+        kwargs: dict
+            the adaptive mode arguments of the DefaultTypeResolver
+        """
+        super(FusedTypeResolver, self).__init__(interceptors=interceptors, **kwargs)
+        for mw in self.interceptors[:-1]:
+            if not isinstance(mw, AdvancedTypeResolver):
+                raise TypeError('expected AdvancedTypeResolvers as interceptors. Got {}'.format(mw))
+
+    def resolve(self, tokens: List[Token]) -> List[Token]:
+        """resolves the non-basic and basic types of all tokens in a single pass.
+
+        Parameters
+        ----------
+        tokens: list of openclean.function.token.base.Token
+            List of string tokens.
+
+        Returns
+        -------
+        list of openclean.function.token.base.Token
+        """
+        resolved = list()
+        start, n = 0, len(tokens)
+        while start < n:
+            if tokens[start].regex_type != TT.ANY:
+                resolved.append(tokens[start])
+                start += 1
+                continue
+            # Find the end of the run of consecutive tokens of type ANY.
+            end = start + 1
+            while end < n and tokens[end].regex_type == TT.ANY:
+                end += 1
+            self._resolve_run(tokens, start, end, 0, resolved)
+            start = end
+        return resolved
+
+    def _resolve_run(self, tokens: List[Token], start: int, end: int, level: int, resolved: List[Token]):
+        """Resolves the tokens[start:end] using the interceptor at the given level and hands the gaps between
+        its matches down to the next interceptor. Appends the results to resolved.
+
+        Parameters
+        ----------
+        tokens: list of openclean.function.token.base.Token
+            List of string tokens.
+        start: int
+            index of the first token of the run
+        end: int
+            index after the last token of the run
+        level: int
+            index of the interceptor to apply
+        resolved: list of openclean.function.token.base.Token
+            the resolved tokens
+        """
+        if level == len(self.active) - 1:
+            for i in range(start, end):
+                token = tokens[i]
+                token.regex_type = BasicTypeResolver.classify(token)
+                resolved.append(token)
+            return
+
+        mw = self.active[level]
+        gap, pos = start, start
+        while pos < end:
+            pidx, label = mw.match(tokens, pos, end)
+            if pidx is None:
+                pos += 1
+                continue
+            if gap < pos:
+                self._resolve_run(tokens, gap, pos, level + 1, resolved)
+            value = ' '.join(tokens[pos:pidx + 1]).strip()
+            resolved.append(Token(value=value, token_type=label, rowidx=tokens[pos].rowidx))
+            gap = pos = pidx + 1
+        if gap < end:
+            self._resolve_run(tokens, gap, end, level + 1, resolved)
+
+
 class BasicTypeResolver(TypeResolver):
     """ Class to resolve to the supported basic types
             STRING = STRING_REP = '\\W+'
@@ -169,20 +323,34 @@ class BasicTypeResolver(TypeResolver):
         for token in tokens:
             # Only consider tokens of type ANY
             if token.regex_type == TT.ANY:
-                if token.isdigit():
-                    token.regex_type = SupportedDataTypes.DIGIT
-                elif token.isalpha():
-                    token.regex_type = SupportedDataTypes.ALPHA
-                elif token.isalnum():
-                    token.regex_type = SupportedDataTypes.ALPHANUM
-                elif token.isspace():
-                    token.regex_type = SupportedDataTypes.SPACE_REP
-                else:
-                    token.regex_type = SupportedDataTypes.PUNCTUATION
+                token.regex_type = self.classify(token)
             resolved.append(token)
         # Return modified token list.
         return resolved
 
+    @staticmethod
+    def classify(value: str) -> str:
+        """Returns the basic type for the given token value.
+
+        Parameters
+        ----------
+        value: str
+            the token value to classify
+
+        Returns
+        -------
+        str
+        """
+        if value.isdigit():
+            return SupportedDataTypes.DIGIT
+        elif value.isalpha():
+            return SupportedDataTypes.ALPHA
+        elif value.isalnum():
+            return SupportedDataTypes.ALPHANUM
+        elif value.isspace():
+            return SupportedDataTypes.SPACE_REP
+        return SupportedDataTypes.PUNCTUATION
+
 
 class AdvancedTypeResolver(TypeResolver, metaclass=ABCMeta):
     """Non-basic type resolver. It lookups the prefix tree for a match and then returns the respective label.
@@ -203,6 +371,30 @@ class AdvancedTypeResolver(TypeResolver, metaclass=ABCMeta):
         """
         self.pt = PrefixTree(vocabulary=vocabulary, ignore_case=ignore_case)
 
+    def match(self, tokens: List[Token], start: int, end: int) -> Tuple[Optional[int], Optional[str]]:
+        """Returns the index of the last token of the longest vocabulary entry
+        that starts at tokens[start] and ends before tokens[end], along with
+        its type label. The result is (None, None) for no matches.
+
+        Parameters
+        ----------
+        tokens: list of openclean.function.token.base.Token
+            The tokens to search for in the prefix tree.
+        start: int
+            index of the first token of the match
+        end: int
+            index after the last token that can be part of the match
+
+        Returns
+        -------
+        tuple of int, str
+        """
+        # Most tokens do not start a vocabulary entry. Reject them without
+        # searching the prefix tree.
+        if not self.pt.may_start(tokens[start]):
+            return None, None
+        return self.pt.prefix_search(tokens, ignore_punc=True, start=start, end=end)
+
     def find_prefixes(self, tokens: List[Token]) -> List[Token]:
         """lookups tokens in prefix tree for matches and sorts the prefixes by descending order in no. of tokens
 
@@ -216,16 +408,19 @@ class AdvancedTypeResolver(TypeResolver, metaclass=ABCMeta):
         list of openclean.function.token.base.Token
         """
         result = list()
-        while tokens:
-            pidx, label = self.pt.prefix_search(tokens, ignore_punc=True)
+        start, n = 0, len(tokens)
+        while start < n:
+            # Walk the trie from the current position instead of slicing off
+            # the consumed tokens.
+            pidx, label = self.match(tokens, start, n)
             if pidx is None:
-                result.append(tokens[0])
-                pidx = 0
+                result.append(tokens[start])
+                pidx = start
             else:
-                value = ' '.join(tokens[:pidx + 1]).strip()
-                token = Token(value=value, token_type=label, rowidx=tokens[0].rowidx)
+                value = ' '.join(tokens[start:pidx + 1]).strip()
+                token = Token(value=value, token_type=label, rowidx=tokens[start].rowidx)
                 result.append(token)
-            tokens = tokens[pidx + 1:]
+            start = pidx + 1
         return result
 
     def resolve(self, tokens: List[Token]) -> List[Token]:
@@ -257,6 +452,122 @@ class AdvancedTypeResolver(TypeResolver, metaclass=ABCMeta):
         return resolved
 
 
+class FuzzyTypeResolver(AdvancedTypeResolver):
+    """Typo tolerant variant of an AdvancedTypeResolver. Tokens that have no exact match in the prefix tree of the
+    wrapped resolver are looked up in a symmetric deletion index of its single word vocabulary entries, e.g. 'stret'
+    resolves to _STREET_ with the AddressDesignatorResolver. A lookup only generates the deletions of the token
+    itself, so it does not depend on the vocabulary size. Multi word entries are only matched exactly.
+
+    Reference: https://github.com/wolfgarbe/SymSpell
+    """
+
+    def __init__(
+        self, resolver: AdvancedTypeResolver, max_distance: Optional[int] = 1, min_length: Optional[int] = 4,
+        cache_size: Optional[int] = 65536
+    ):
+        """builds the deletion index from the vocabulary of the resolver
+
+        Parameters
+        ----------
+        resolver: AdvancedTypeResolver
+            the resolver whose vocabulary should be matched with typos
+        max_distance: int (default: 1)
+            maximum no. of edits (insertions, deletions, substitutions, adjacent swaps) between a token and
+            a vocabulary entry
+        min_length: int (default: 4)
+            shorter tokens and vocabulary entries are only matched exactly, as short words are too ambiguous
+        cache_size: int (default: 65536)
+            no. of lookup results to cache
+        """
+        # share the prefix tree for the exact matches
+        self.pt = resolver.pt
+        self.max_distance = max_distance
+        self.min_length = min_length
+
+        self.labels = dict()
+        self.index = defaultdict(list)
+        sep = self.pt.trie._separator
+        for key, (_, label) in self.pt.trie.items():
+            if sep in key or len(key) < min_length:
+                continue
+            self.labels[key] = label
+            for variant in self._deletions(key):
+                self.index[variant].append(key)
+
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def _deletions(self, word: str) -> Set[str]:
+        """returns all strings that result from deleting up to max_distance characters from the word.
+
+        Parameters
+        ----------
+        word: str
+            the string to generate deletions for
+
+        Returns
+        -------
+        set of str
+        """
+        variants = {word}
+        level = {word}
+        for _ in range(self.max_distance):
+            level = {w[:i] + w[i + 1:] for w in level for i in range(len(w))}
+            variants.update(level)
+        return variants
+
+    def _lookup(self, token: str) -> Optional[str]:
+        """returns the label of the closest vocabulary entry within max_distance of the token. Ties are broken by
+        the alphabetical order of the entries. Returns None if there is no such entry.
+
+        Parameters
+        ----------
+        token: str
+            the token to look up
+
+        Returns
+        -------
+        str
+        """
+        if self.pt.ignore_case:
+            token = token.lower()
+        if len(token) < self.min_length or not token.isalpha():
+            return None
+        candidates = set()
+        for variant in self._deletions(token):
+            candidates.update(self.index.get(variant, ()))
+        best = None
+        for word in candidates:
+            # the deletion index over-approximates, e.g. for substitutions at different positions
+            dist = StringComparator.edit_distance(token, word)
+            if dist <= self.max_distance and (best is None or (dist, word) < best):
+                best = (dist, word)
+        return self.labels[best[1]] if best is not None else None
+
+    def match(self, tokens: List[Token], start: int, end: int) -> Tuple[Optional[int], Optional[str]]:
+        """Returns the longest exact match starting at tokens[start] or, if there is none, the label of the closest
+        single word vocabulary entry for tokens[start].
+
+        Parameters
+        ----------
+        tokens: list of openclean.function.token.base.Token
+            The tokens to search for in the prefix tree.
+        start: int
+            index of the first token of the match
+        end: int
+            index after the last token that can be part of the match
+
+        Returns
+        -------
+        tuple of int, str
+        """
+        pidx, label = super(FuzzyTypeResolver, self).match(tokens, start, end)
+        if pidx is None:
+            label = self.lookup(tokens[start])
+            if label is not None:
+                pidx = start
+        return pidx, label
+
+
 class DateResolver(AdvancedTypeResolver):
     """Resolves date times."""
 
@@ -17,7 +17,7 @@ from openclean_pattern.collect.factory import CollectorFactory
 from openclean_pattern.collect.group import COLLECT_GROUP
 from openclean_pattern.align.pad import ALIGN_PAD
 from openclean_pattern.align.base import Aligner
-from openclean_pattern.collect.base import Collector
+from openclean_pattern.collect.base import Collector, column_size
 
 from openclean_pattern.regex.compiler import RegexCompiler, COMPILER_DEFAULT
 from openclean_pattern.regex.factory import CompilerFactory
@@ -26,14 +26,18 @@ from openclean_pattern.evaluate.evaluator import Evaluator
 from openclean_pattern.utils.utils import WeightedRandomSampler, Distinct
 from openclean_pattern.regex.base import OpencleanPattern
 
+import logging
+import numpy as np
 import pandas as pd
 
-from typing import Union, List, Dict
+from typing import Optional, Union, List, Dict, Tuple
 from collections import Counter
 
 from openclean.profiling.pattern.base import PatternFinder
 from openclean.profiling.base import ProfilerResult
 
+logger = logging.getLogger(__name__)
+
 
 class OpencleanPatternFinder(PatternFinder):
     """
@@ -46,7 +50,10 @@ class OpencleanPatternFinder(PatternFinder):
                  tokenizer: Union[str, Tokenizer] = TOKENIZER_DEFAULT,
                  collector: Union[str, Collector] = COLLECT_GROUP,
                  aligner: Union[str, Aligner] = ALIGN_PAD,
-                 compiler: Union[str, RegexCompiler] = COMPILER_DEFAULT) -> None:
+                 compiler: Union[str, RegexCompiler] = COMPILER_DEFAULT,
+                 max_memory: Optional[int] = None,
+                 max_operations: Optional[float] = None,
+                 fallback: Union[str, Collector, None] = COLLECT_GROUP) -> None:
         """
         Initialize the pattern finder class. This assumes that the input columns have been sampled if too large
 
@@ -64,6 +71,15 @@ class OpencleanPatternFinder(PatternFinder):
             the aligner to use
         compiler: RegexCompiler (default: 'default')
             compiles the aligned tokens into Pattern objects
+        max_memory: int (default: None)
+            the budget in bytes for the largest array of the collector or the aligner, e.g. 2 ** 30. None disables
+            the check
+        max_operations: float (default: None)
+            the budget of token operations of the collector or of the aligner, e.g. 1e9. None disables the check
+        fallback: str or Collector or None (default: 'group')
+            the collector to use if the estimate of the collector exceeds the budget. If None, the collector runs
+            on the largest random sample of rows within the budget. Aligners that exceed the budget always fall
+            back to padding
         """
         super(OpencleanPatternFinder, self).__init__()
         self.frac = frac
@@ -77,6 +93,9 @@ class OpencleanPatternFinder(PatternFinder):
         self.patterns = None
         self.outliers = dict()
         self._compiler = compiler if isinstance(compiler, RegexCompiler) else CompilerFactory.create_compiler(compiler)
+        self.max_memory = max_memory
+        self.max_operations = max_operations
+        self.fallback = fallback
 
     def process(self, values: Counter) -> ProfilerResult:
         """Compute one or more features over a set of distinct values. This is
@@ -209,7 +228,9 @@ class OpencleanPatternFinder(PatternFinder):
 
         # encode is a two step method. it does both, the tokenization and the type resolution in the same go
         tokenized = tokenizer.encode(column)
+        collector, tokenized = self._plan_collector(collector, tokenized)
         groups = collector.collect(tokenized)
+        aligner = self._plan_aligner(aligner, tokenized, groups)
         self._aligned = aligner.align(tokenized, groups)
 
         self.patterns = compiler.compile(self._aligned, groups)
@@ -223,6 +244,111 @@ class OpencleanPatternFinder(PatternFinder):
 
         return self.patterns
 
+    def _has_budget(self) -> bool:
+        """checks if any budget is configured
+
+        Returns
+        -------
+            bool
+        """
+        return self.max_memory is not None or self.max_operations is not None
+
+    def _within_budget(self, memory: int, operations: float) -> bool:
+        """checks an estimate against the configured budgets
+
+        Parameters
+        ----------
+        memory: int
+            the estimated memory in bytes
+        operations: float
+            the estimated no. of token operations
+
+        Returns
+        -------
+            bool
+        """
+        return (self.max_memory is None or memory <= self.max_memory) and \
+            (self.max_operations is None or operations <= self.max_operations)
+
+    def _plan_collector(self, collector: Collector, tokenized: List) -> Tuple[Collector, List]:
+        """estimates the cost of the collector on the tokenized rows before it runs. If
+        the estimate exceeds the budget, the fallback collector is returned or, if there is none, the rows are
+        sampled down to the largest no. of rows within the budget. The sampled values are encoded again so that the
+        row indices of their tokens point to self.values.
+
+        Parameters
+        ----------
+        collector: Collector
+            the configured collector
+        tokenized: list
+            the tokenized rows
+
+        Returns
+        -------
+            tuple of the collector to use and the rows to collect
+        """
+        if not self._has_budget():
+            return collector, tokenized
+        n, length = column_size(tokenized)
+        memory, operations = collector.estimate(tokenized)
+        if self._within_budget(memory, operations):
+            return collector, tokenized
+
+        reason = "{} collector on {} rows of {:.1f} tokens needs ~{:.0f} MB and ~{:.2e} operations".format(
+            collector.collector_type, n, length, memory / 2 ** 20, operations
+        )
+        if self.fallback is not None:
+            fallback = self.fallback if isinstance(self.fallback, Collector) else \
+                CollectorFactory.create_collector(self.fallback)
+            logger.warning("%s, over the budget. falling back to the %s collector", reason, fallback.collector_type)
+            return fallback, tokenized
+
+        # the estimates grow with the sample, find the largest sample within the budget
+        order = np.random.RandomState(42).permutation(n)
+        low, high = 1, n
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._within_budget(*collector.estimate([tokenized[i] for i in order[:mid]])):
+                low = mid
+            else:
+                high = mid - 1
+        logger.warning("%s, over the budget. sampling %d rows", reason, low)
+        sample = np.sort(order[:low])
+        self.values = [self.values[i] for i in sample]
+        return collector, self._tokenizer.encode(self.values)
+
+    def _plan_aligner(self, aligner: Aligner, tokenized: List, groups: Dict) -> Aligner:
+        """estimates the cost of the aligner on the rows of each group. If the estimate of any group exceeds the
+        budget, the groups are padded instead.
+
+        Parameters
+        ----------
+        aligner: Aligner
+            the configured aligner
+        tokenized: list
+            the tokenized rows
+        groups: dict
+            the collected groups
+
+        Returns
+        -------
+            the aligner to use
+        """
+        if not self._has_budget():
+            return aligner
+        for idx in groups.values():
+            group = [tokenized[i] for i in idx]
+            length = column_size(group)[1]
+            memory, operations = aligner.estimate(group)
+            if not self._within_budget(memory, operations):
+                logger.warning(
+                    "%s aligner on a group of %d rows of %.1f tokens needs ~%.0f MB and ~%.2e operations, over the "
+                    "budget. falling back to the %s aligner", aligner.alignment_type, len(idx), length,
+                    memory / 2 ** 20, operations, ALIGN_PAD
+                )
+                return AlignerFactory.create_aligner(ALIGN_PAD)
+        return aligner
+
     def _parse(self, value):
         """parses values to the internal 'Tokens' representation
         """
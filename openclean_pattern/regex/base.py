@@ -22,6 +22,21 @@ from openclean_pattern.utils.utils import StringComparator
 from openclean.profiling.pattern.base import Pattern
 
 
+def row_index(row: Iterable[Token]) -> Optional[int]:
+    """returns the row index carried by the tokens of a row. Shared gap tokens don't carry one
+
+    Parameters
+    ----------
+    row: iterable of Token
+        the tokens of the row
+
+    Returns
+    -------
+        int or None
+    """
+    return next((token.rowidx for token in row if token.rowidx is not None), None)
+
+
 class OpencleanPattern(Pattern, metaclass=ABCMeta):
     """Contains PatternElements used inside the Patterns class to store a single row / column pattern"""
 
@@ -117,13 +132,15 @@ class OpencleanPattern(Pattern, metaclass=ABCMeta):
         return this
 
     @abstractmethod
-    def update(self, tokens: Iterable[Token]) -> None:
+    def update(self, tokens: Iterable[Token], rowidx: Optional[int] = None) -> None:
         """update using the tokens, the list (of OpencleanPattern Elements
 
         Parameters
         ----------
          tokens: Token
             the tokens to use create the OpencleanPattern
+         rowidx: int (optional)
+            the row index of the tokens, if they don't carry it
         """
         raise NotImplementedError()
 
@@ -219,18 +236,22 @@ class SingularRowPattern(OpencleanPattern):
 
         return True
 
-    def update(self, tokens: Iterable[Token]) -> None:
+    def update(self, tokens: Iterable[Token], rowidx: Optional[int] = None) -> None:
         """update using the tokens, the list (of OpencleanPattern Elements
 
         Parameters
         ----------
          tokens: tuple(Token)
             the tokens to use create the OpencleanPattern
+         rowidx: int (optional)
+            the row index of the tokens, if they don't carry it
         """
+        if rowidx is None:
+            rowidx = row_index(tokens)
         for r, e in zip(tokens, self):
-            e.update(r)
+            e.update(r, rowidx)
 
-        self.idx.add(r.rowidx)
+        self.idx.add(rowidx)
         self.freq += 1
 
 
@@ -252,13 +273,15 @@ class SingularColumnPattern(OpencleanPattern):
         self.column_freq = 0
         self.size_coverage = size_coverage
 
-    def update(self, tokens: Token):
+    def update(self, tokens: Token, rowidx: Optional[int] = None):
         """update the column pattern using the tokens, the list (of OpencleanPattern Elements
 
         Parameters
         ----------
          tokens: Token
             the tokens to use create the OpencleanPattern
+         rowidx: int (optional)
+            the row index of the tokens, if they don't carry it
         """
         if isinstance(tokens, Token):
             tokens = [tokens]
@@ -267,13 +290,13 @@ class SingularColumnPattern(OpencleanPattern):
                 raise TypeError("expected: openclean.function.token.base.Token, got: {}".format(token.__class__))
 
             if token.regex_type not in self.container:
-                self[token.regex_type] = PatternElementSizeMonitor(threshold=self.size_coverage).update(token)
+                self[token.regex_type] = PatternElementSizeMonitor(threshold=self.size_coverage).update(token, rowidx)
             else:
-                self[token.regex_type].update(token)
+                self[token.regex_type].update(token, rowidx)
 
         # Profile of all the tokens that went into creating this pattern,
         # not just the ones that created the final pattern element
-        self.idx.add(token.rowidx)
+        self.idx.add(token.rowidx if rowidx is None else rowidx)
         self.column_freq += 1
         self.column_min = min(self.column_min, token.size)
         self.column_max = max(self.column_max, token.size)
@@ -333,7 +356,7 @@ class Patterns(defaultdict, metaclass=ABCMeta):
         return key.strip()
 
     @abstractmethod
-    def insert(self, row):
+    def insert(self, row, rowidx: Optional[int] = None):
         """insert the row into the respective method"""
         raise NotImplementedError()
 
@@ -439,13 +462,17 @@ class RowPatterns(Patterns):
         """
         super(RowPatterns, self).__init__(size_coverage)
 
-    def insert(self, row: Iterable[Token]):
+    def insert(self, row: Iterable[Token], rowidx: Optional[int] = None):
         """Inserts a row into the discovered patterns or updates the PatternRow object
 
         Parameters
         ----------
         row : tuple of Tokens
+        rowidx : int (optional)
+            the row index, defaults to the one carried by the tokens
         """
+        if rowidx is None:
+            rowidx = row_index(row)
 
         self.global_freq += 1
         types = list()
@@ -456,11 +483,11 @@ class RowPatterns(Patterns):
         if key not in self:
             self[key] = SingularRowPattern()
             for r in row:
-                self[key].append(PatternElementSizeMonitor(threshold=self.size_coverage).update(r))
+                self[key].append(PatternElementSizeMonitor(threshold=self.size_coverage).update(r, rowidx))
             self[key].freq += 1
-            self[key].idx.add(r.rowidx)
+            self[key].idx.add(rowidx)
         else:
-            self[key].update(row)
+            self[key].update(row, rowidx)
 
     def condense(self):
         """executes the pattern element size monitors and creates final pattern elements that have anomalous values
@@ -543,14 +570,18 @@ class ColumnPatterns(Patterns):
         """
         super(ColumnPatterns, self).__init__(size_coverage)
 
-    def insert(self, row: Iterable[Token]):
+    def insert(self, row: Iterable[Token], rowidx: Optional[int] = None):
         """insert the row into the respective method
 
         Parameters
         ----------
         row : list of Tokens
             the tokens to insert/ use to update the respective PatternColumnElement
+        rowidx : int (optional)
+            the row index, defaults to the one carried by the tokens
         """
+        if rowidx is None:
+            rowidx = row_index(row)
         self.global_freq += 1
         for key, token in enumerate(row):
             if not isinstance(token, Token):
@@ -559,7 +590,7 @@ class ColumnPatterns(Patterns):
             if key not in self:
                 self[key] = SingularColumnPattern(self.size_coverage)
 
-            self[key].update(token)
+            self[key].update(token, rowidx)
 
     def condense(self):
         """finds the top element in each column and returns the derived pattern
@@ -620,14 +651,14 @@ class PatternElementSet(object):
         self.idx = set()
         self.freq = 0
 
-    def add(self, token: Token):
+    def add(self, token: Token, rowidx: Optional[int] = None):
         if self.regex_type is None:
             self.regex_type = token.regex_type
             self.size = token.size
         elif token.regex_type is not self.regex_type:
             raise Exception("Incompatible Token used to update PatternElementSet")
         self.values.add(token.value)
-        self.idx.add(token.rowidx)
+        self.idx.add(token.rowidx if rowidx is None else rowidx)
         self.freq += 1
 
         return self
@@ -660,15 +691,17 @@ class PatternElementSizeMonitor(defaultdict):
         self.freq = 0
         self.threshold = threshold
 
-    def update(self, token: Token):
+    def update(self, token: Token, rowidx: Optional[int] = None):
         """update the elements in the tracker
 
         Parameters
         ----------
         token: Token
             the token object to insert into the monitor
+        rowidx: int (optional)
+            the row index of the token, if it doesn't carry it
         """
-        self[token.size].add(token)
+        self[token.size].add(token, rowidx)
         self.freq += 1
 
         return self
@@ -763,17 +796,19 @@ class PatternElement(object):
         if token is not None:
             self.from_set(token)  # init PatternElement from PatternElementSet
 
-    def update(self, next_input: Union[PatternElementSet, Token]):
+    def update(self, next_input: Union[PatternElementSet, Token], rowidx: Optional[int] = None):
         """updates the PatternElement object
 
         Parameters
         ----------
         next_input : Token or PatternElementSet
             the token or set to update this PatternElement object
+        rowidx : int (optional)
+            the row index of a token that doesn't carry it
 
         """
         if isinstance(next_input, Token):
-            next_input = PatternElementSet().add(next_input)
+            next_input = PatternElementSet().add(next_input, rowidx)
 
         if isinstance(next_input, PatternElementSet):
             if next_input.regex_type == SupportedDataTypes.PUNCTUATION:
@@ -31,13 +31,15 @@ class RegexCompiler(metaclass=ABCMeta):
         self.per_group = per_group
 
     @abstractmethod
-    def compile_each(self, group):
+    def compile_each(self, group, rowidxs=None):
         """
         Accepts individual groups and compiles the pattern
         Parameters
         ----------
         group :  List[List[openclean.function.token.base.Token]]
             tokenized rows
+        rowidxs : List[int] (optional)
+            the row indices of the group, in case the tokens don't carry them
 
         Returns
         -------
@@ -64,7 +66,7 @@ class RegexCompiler(metaclass=ABCMeta):
         patterns = dict()
         for gr, rowidxs in groups.items():
             group = [tokenized_column[i] for i in rowidxs]
-            patterns[gr] = self.compile_each(group=group)
+            patterns[gr] = self.compile_each(group=group, rowidxs=rowidxs)
         return patterns
 
     def mismatches(self, tokenized_column, patterns):
@@ -150,21 +152,25 @@ class DefaultRegexCompiler(RegexCompiler):
         self.method = method
         self.size_coverage = size_coverage
 
-    def compile_each(self, group):
+    def compile_each(self, group, rowidxs=None):
         """Accepts individual groups and compiles a majority pooled pattern based on the top share
 
         Parameters
         ----------
         group :  List[List[openclean.function.token.base.Token]]
             tokenized rows
+        rowidxs : List[int] (optional)
+            the row indices of the group, in case the tokens don't carry them
 
         Returns
         -------
             PatternRows
         """
         patterns = self.pattern_generator()
-        for row in group:
-            patterns.insert(row)
+        if rowidxs is None:
+            rowidxs = [None] * len(group)
+        for row, rowidx in zip(group, rowidxs):
+            patterns.insert(row, rowidx)
 
         # Incase the patterns are calculated differently from the base row
         # calculation method, the condense method converts the format.
@@ -14,6 +14,10 @@ import string
 import warnings
 
 
+# Tokens that are skipped inside a multi-word prefix when ignore_punc is True.
+PUNCTUATION = frozenset(list(string.punctuation) + [' '])
+
+
 class PrefixTree(object):
     """Prefix Tree class to create a map using the provided vocabulary and prefix search it
     """
@@ -30,6 +34,8 @@ class PrefixTree(object):
         """
         self.ignore_case = ignore_case
         self.trie = pygtrie.StringTrie()
+        # first trie level of all vocabulary entries to reject misses early
+        first_steps = set()
         for words, label in vocabulary:
             for word in words:
                 if ignore_case:
@@ -40,8 +46,82 @@ class PrefixTree(object):
                         warnings.warn("duplicate pytrie entry '{}' with different label: '{}' found. Original label: {} is immutable, Ignoring duplicate.".format(word, label, self.trie[dom_word][1]))
                     continue
                 self.trie[dom_word] = (word, label)
+                first_steps.add(dom_word.partition(self.trie._separator)[0])
+        self.first_steps = frozenset(first_steps)
+
+    @property
+    def root(self):
+        """Cursor pointing to the root node of the trie. Use with `advance` to
+        walk the trie one token at a time.
+
+        Returns
+        -------
+        pygtrie._Node
+        """
+        return self.trie._root
+
+    def advance(self, node, token: str):
+        """Advances the cursor from the given trie node by a single token.
+        Returns None if the extended prefix is not in the trie.
+
+        Parameters
+        ----------
+        node: pygtrie._Node
+            the cursor to advance from, e.g. PrefixTree.root
+        token: str
+            the next token in the prefix
+
+        Returns
+        -------
+        pygtrie._Node or None
+        """
+        if self.ignore_case:
+            token = token.lower()
+        # Tokens that contain the separator span multiple trie levels.
+        for step in token.split(self.trie._separator):
+            node = node.children.get(step)
+            if node is None:
+                return None
+        return node
+
+    def may_start(self, token: str) -> bool:
+        """Returns False if no vocabulary entry starts with the given token.
+        This is a constant time check that does not walk the trie.
 
-    def prefix_search(self, content_words: List[str], ignore_punc: Optional[bool] = True) -> Tuple[int, str]:
+        Parameters
+        ----------
+        token: str
+            the first token of a prefix
+
+        Returns
+        -------
+        bool
+        """
+        if self.ignore_case:
+            token = token.lower()
+        return token.partition(self.trie._separator)[0] in self.first_steps
+
+    @staticmethod
+    def label(node) -> Optional[str]:
+        """Returns the type label of the vocabulary entry that ends at the
+        given node or None if the node is only an inner node of the trie.
+
+        Parameters
+        ----------
+        node: pygtrie._Node
+            the cursor to get the label for
+
+        Returns
+        -------
+        str
+        """
+        value = node.value
+        return value[1] if isinstance(value, tuple) else None
+
+    def prefix_search(
+        self, content_words: List[str], ignore_punc: Optional[bool] = True, start: Optional[int] = 0,
+        end: Optional[int] = None
+    ) -> Tuple[int, str]:
         """Identifies prefixe matches for the given word list from the vocabulary
         that was used to build the prefix tree.
 
@@ -54,40 +134,33 @@ class PrefixTree(object):
             the string to perform the search on
         ignore_punc: bool (default: True)
             searches through the content words ignoring any punctuations in between
+        start: int (default: 0)
+            index of the first content word of the prefix. The returned index
+            is relative to the beginning of content_words
+        end: int (default: None)
+            index after the last content word that can be part of the prefix.
+            Defaults to len(content_words)
 
         Returns
         -------
         tuple of int, str
         """
-        punc = list(string.punctuation) + [' ']
-        # Shortcut to access the trie separator.
-        sep = self.trie._separator
-        prefix_path = list()
-        for i, token in enumerate(content_words):
+        last = (len(content_words) if end is None else end) - 1
+        node = self.root
+        index, label = None, None
+        for i in range(start, last + 1):
+            token = content_words[i]
             # Ignore punctuation tokens if the respective flag is True. We do
             # need to make sure, however, not to ignore leading puctuation
             # tokens.
-            if ignore_punc and prefix_path:
-                if token in punc and i < len(content_words)-1:
-                    continue
-            # Convert to lower case for case-insentive matching.
-            if self.ignore_case:
-                token = token.lower()
-            # Get value for prefix from previous iteration from the prefix path.
-            prefix = '{}{}{}'.format(prefix_path[-1][0], sep, token) if prefix_path else token
-            prefix_in_trie = self.trie.has_node(prefix)
-            if not prefix_in_trie:
+            if ignore_punc and i > start and i < last and token in PUNCTUATION:
+                continue
+            node = self.advance(node, token)
+            if node is None:
                 break
-            # Get the label for the matched prefix. Note that the value is only
-            # defined if the prefix matches a value (and not just a subtree).
-            if prefix_in_trie & pygtrie.Trie.HAS_VALUE:
-                _, label = self.trie.get(prefix)
-            else:
-                label = None
-            prefix_path.append((prefix, i, label, prefix_in_trie))
-        # Find maximum entry in the prefix path that points to a value.
-        while prefix_path:
-            _, index, label, prefix_in_trie = prefix_path.pop()
-            if prefix_in_trie & pygtrie.Trie.HAS_VALUE:
-                return index, label
-        return None, None
+            # Keep the longest prefix that points to a value (and not just
+            # a subtree).
+            node_label = self.label(node)
+            if node_label is not None:
+                index, label = i, node_label
+        return index, label
@@ -12,6 +12,7 @@ import re
 from openclean.data.types import Scalar
 from openclean.function.token.base import Token, Tokenizer
 from openclean_pattern.datatypes.resolver import DefaultTypeResolver, TypeResolver
+from openclean_pattern.utils.utils import RandomSampler
 
 TOKENIZER_REGEX = 'punc'
 
@@ -53,10 +54,53 @@ class RegexTokenizer(Tokenizer):
         self.regex = regex
         self.abbreviations = abbreviations
 
+    def encode(self, values: List[Scalar]) -> List[List[Token]]:
+        """Encodes all values in a given column. If the type resolver is in adaptive mode, its interceptors are
+        first probed on a random sample of the column.
+
+        Parameters
+        ----------
+        values: list of scalar
+            List of column values
+
+        Returns
+        -------
+        list of list of openclean.function.token.base.Token
+        """
+        if getattr(self.type_resolver, 'adaptive', False):
+            values = list(values)
+            sample = values
+            if len(values) > self.type_resolver.sample_size:
+                sample = RandomSampler(values, n=self.type_resolver.sample_size, random_state=42).sample()
+            self.type_resolver.adapt([self.split(value) for value in sample])
+        return super(RegexTokenizer, self).encode(values)
+
     def tokens(self, value: Scalar, rowidx: Optional[int] = None) -> List[Token]:
+        """ tokenizes a single row value and resolves the token types using the type resolver.
+
+        Parameters
+        ----------
+        rowidx: int
+            row id
+        value: str
+            value to tokenize
+
+        Returns
+        -------
+        list of openclean.function.token.Token
+        """
+        tokens = self.split(value, rowidx=rowidx)
+
+        if self.type_resolver is not None:
+            tokens = self.type_resolver.resolve(tokens)
+
+        return tokens
+
+    def split(self, value: Scalar, rowidx: Optional[int] = None) -> List[Token]:
         """ tokenizes a single row value by applying the regular expression splitter.
         if abbreviations == True, the dots will be stripped at this stage to type_recognize the initials together
-        furthermore we split on underscores as they are considered as \\w characters in regex
+        furthermore we split on underscores as they are considered as \\w characters in regex. The token types
+        are not resolved.
 
         Parameters
         ----------
@@ -80,12 +124,7 @@ class RegexTokenizer(Tokenizer):
                 abbreviation_updated.append(tok)
             post_regex = abbreviation_updated
 
-        tokens = [Token(value=item, rowidx=rowidx) for sublist in [re.split('(_)', j) for j in post_regex] for item in sublist]
-
-        if self.type_resolver is not None:
-            tokens = self.type_resolver.resolve(tokens)
-
-        return tokens
+        return [Token(value=item, rowidx=rowidx) for sublist in [re.split('(_)', j) for j in post_regex] for item in sublist]
 
 
 TOKENIZER_DEFAULT = 'default'
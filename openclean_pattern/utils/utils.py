@@ -97,6 +97,34 @@ class StringComparator(Comparator):
 
         return anslist
 
+    @staticmethod
+    def edit_distance(s1, s2):
+        """
+        Computes the optimal string alignment distance between two strings, i.e. the
+        levenshtein distance where swapping two adjacent characters counts as a single edit
+
+        Parameters
+        ----------
+        s1 : str
+            string 1
+        s2 : str
+            string 2
+
+        Returns
+        -------
+            int
+        """
+        prev2, prev = None, list(range(len(s2) + 1))
+        for i in range(1, len(s1) + 1):
+            cur = [i] + [0] * len(s2)
+            for j in range(1, len(s2) + 1):
+                cost = 0 if s1[i - 1] == s2[j - 1] else 1
+                cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+                if i > 1 and j > 1 and s1[i - 1] == s2[j - 2] and s1[i - 2] == s2[j - 1]:
+                    cur[j] = min(cur[j], prev2[j - 2] + 1)
+            prev2, prev = prev, cur
+        return prev[-1]
+
 
 def has_numbers(inputString):
     return bool(re.search(r'\d', inputString))
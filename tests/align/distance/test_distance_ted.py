@@ -8,6 +8,7 @@
 """unit tests for the tree edit distance class"""
 
 from openclean_pattern.align.distance.factory import DistanceFactory
+from openclean_pattern.align.distance.tree_edit import TreeEditDistance
 from openclean_pattern.tokenize.factory import DefaultTokenizer
 
 
@@ -23,3 +24,15 @@ def test_distance_ted_compute(dates):
 
     for i, j in zip(distances, [8/9, 8/9, 0.2, 0.8]):
         assert i == j
+
+
+def test_distance_ted_pairwise(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    for strict in [True, False]:
+        dist = TreeEditDistance(strict=strict)
+        distances = dist.pairwise(rows, block_size=50)
+        assert distances.shape == (len(rows), len(rows))
+        for u in range(len(rows)):
+            for v in range(len(rows)):
+                assert distances[u][v] == dist.compute(rows[u], rows[v])
@@ -0,0 +1,50 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for CenterStarAligner class"""
+
+from openclean_pattern.align.factory import AlignerFactory
+from openclean_pattern.align.center import CenterStarAligner
+from openclean_pattern.collect.base import distinct_signatures
+from openclean_pattern.collect.cluster import Cluster
+from openclean_pattern.datatypes.base import SupportedDataTypes
+from openclean_pattern.tokenize.factory import DefaultTokenizer
+
+ADDRESSES = ['23 Jay Allen St', '245 Mercer St', 'Allen St', '5th Ave', '7th Ave', '234 Broadway', '12 W 4th St']
+
+
+def test_center_align():
+    rows = DefaultTokenizer().encode(ADDRESSES)
+    distinct, _, counts = distinct_signatures(rows)
+    # '5th Ave' and '7th Ave' share the most frequent signature
+    assert CenterStarAligner(center='frequent').find_center(distinct, counts) == 3
+
+    for center in ['frequent', 'medoid']:
+        aligned = CenterStarAligner(center=center).align(rows, {0: list(range(len(rows)))})
+        values = [[None if t.regex_type == SupportedDataTypes.GAP else str(t) for t in row] for row in aligned]
+        assert len({len(row) for row in values}) == 1
+        # the gaps inserted in the center by the longer rows are inserted in all the rows
+        assert values[3] == [None, None, '5th', ' ', 'ave', None, None]
+        assert values[6] == ['12', ' ', 'w', ' ', '4th', ' ', 'st']
+        for row, tokens in zip(aligned, rows):
+            # only gaps are inserted
+            assert [t for t in row if t.regex_type != SupportedDataTypes.GAP] == list(tokens)
+
+
+def test_center_align_groups(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+    groups = Cluster(dist='TED', min_samples=3).collect(rows)
+    aligned = AlignerFactory.create_aligner('center').align(rows, groups)
+
+    for idx in groups.values():
+        assert len({len(aligned[i]) for i in idx}) == 1
+    for row, tokens in zip(aligned, rows):
+        assert [t for t in row if t.regex_type != SupportedDataTypes.GAP] == list(tokens)
+
+    for backend in ['thread', 'process']:
+        parallel = CenterStarAligner(n_jobs=2, backend=backend).align(rows, groups)
+        assert [[t.regex_type for t in row] for row in parallel] == [[t.regex_type for t in row] for row in aligned]
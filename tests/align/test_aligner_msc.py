@@ -0,0 +1,51 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for MSCAligner class"""
+
+from openclean_pattern.align.factory import AlignerFactory
+from openclean_pattern.align.smart import MSCAligner
+from openclean_pattern.collect.group import Group
+from openclean_pattern.datatypes.base import SupportedDataTypes
+from openclean_pattern.tokenize.factory import DefaultTokenizer
+
+ADDRESSES = ['23 Jay Allen St', '245 Mercer St', 'Allen St', '5th Ave', '7th Ave', '234 Broadway']
+
+
+def test_msc_align():
+    rows = DefaultTokenizer().encode(ADDRESSES)
+    aligned = MSCAligner().align(rows, {0: list(range(len(rows)))})
+
+    values = [[None if t.regex_type == SupportedDataTypes.GAP else str(t) for t in row] for row in aligned]
+    assert len({len(row) for row in values}) == 1
+    # the street suffixes never appear together and line up in the last column
+    assert [row[-1] for row in values] == ['st', 'st', 'st', 'ave', 'ave', None]
+    # the tokens before the anchor are right aligned against it
+    assert values[2][-3:] == ['allen', ' ', 'st']
+    assert values[5][:3] == ['234', ' ', 'broadway']
+
+
+def test_msc_align_groups(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+    groups = Group().collect(rows)
+    aligned = AlignerFactory.create_aligner('msc').align(rows, groups)
+
+    for idx in groups.values():
+        assert len({len(aligned[i]) for i in idx}) == 1
+    for row, tokens in zip(aligned, rows):
+        # only gaps are inserted
+        assert [t for t in row if t.regex_type != SupportedDataTypes.GAP] == list(tokens)
+
+
+def test_msc_align_parallel(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+    groups = Group().collect(rows)
+
+    aligned = MSCAligner().align(rows, groups)
+    for backend in ['thread', 'process']:
+        parallel = MSCAligner(n_jobs=2, backend=backend).align(rows, groups)
+        assert [[str(t) for t in row] for row in parallel] == [[str(t) for t in row] for row in aligned]
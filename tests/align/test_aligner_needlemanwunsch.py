@@ -11,6 +11,7 @@
 from openclean_pattern.align.needlemanwunsch import NeedlemanWunschAligner
 from openclean_pattern.tokenize.factory import DefaultTokenizer
 from openclean_pattern.datatypes.base import SupportedDataTypes
+from openclean_pattern.align.distance.tree_edit import TreeEditDistance
 
 
 def test_needlemanwunsch():
@@ -42,3 +43,43 @@ def test_needlemanwunsch():
     assert aligned[0][0].regex_type == aligned[1][0].regex_type == SupportedDataTypes.ALPHANUM
     assert aligned[0][1].regex_type == SupportedDataTypes.SPACE_REP and aligned[1][1].regex_type == SupportedDataTypes.PUNCTUATION
     assert aligned[0][-1].regex_type == aligned[1][-1].regex_type == SupportedDataTypes.ALPHA
+
+
+def test_needlemanwunsch_gaps_together():
+    """test the needleman wunsch aligner that keeps gaps together"""
+    rows = DefaultTokenizer().encode(['W. 125 ST', 'W125 ST'])
+    aligned = NeedlemanWunschAligner(keep_gaps_together=True).align(rows)
+
+    assert len(aligned[0]) == len(aligned[1])
+    assert [t.regex_type for t in aligned[1]] == [
+        SupportedDataTypes.GAP, SupportedDataTypes.GAP, SupportedDataTypes.GAP, SupportedDataTypes.ALPHANUM,
+        SupportedDataTypes.SPACE_REP, SupportedDataTypes.ALPHA
+    ]
+
+
+def test_needlemanwunsch_band():
+    """test the banded needleman wunsch aligner"""
+    rows = DefaultTokenizer().encode(['W. 125 ST', 'W125 ST', '12BROADWAY.AVE'])
+    nwa, banded = NeedlemanWunschAligner(), NeedlemanWunschAligner(band=0)
+
+    for x, y in [(0, 1), (1, 2), (0, 2)]:
+        assert nwa._align(rows[x], rows[y]) == banded._align(rows[x], rows[y])
+
+    # the optimal path leaves the band although the banded one doesn't touch its edge
+    x, y = DefaultTokenizer().encode(['1.aa.11...', ' -1 -ab1 ab1ab1aab1ab1'])
+    for band in [0, 1]:
+        banded = NeedlemanWunschAligner(band=band)
+        assert nwa._align(x, y) == banded._align(x, y)
+        assert nwa.distance(x, y) == banded.distance(x, y)
+
+
+def test_needlemanwunsch_distance():
+    """test the score only distance against the distance of the aligned pair"""
+    rows = DefaultTokenizer().encode(['W. 125 ST', 'W125 ST', '12BROADWAY.AVE', '5th Avenue'])
+    distance = TreeEditDistance(strict=False)
+
+    for nwa in [NeedlemanWunschAligner(), NeedlemanWunschAligner(band=0), NeedlemanWunschAligner(keep_gaps_together=True)]:
+        for x in rows:
+            for y in rows:
+                assert nwa.distance(x, y) == distance.compute(*nwa.align([x, y]))
+    assert NeedlemanWunschAligner().distance(rows[0], []) == 1
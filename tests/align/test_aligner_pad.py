@@ -13,6 +13,7 @@ from openclean_pattern.collect.cluster import Cluster
 from openclean_pattern.tokenize.factory import DefaultTokenizer, RegexTokenizer
 from openclean_pattern.datatypes.resolver import AddressDesignatorResolver, DefaultTypeResolver
 from openclean_pattern.regex.compiler import DefaultRegexCompiler
+from openclean_pattern.datatypes.base import GAP_TOKEN, SupportedDataTypes
 
 
 def test_padder_align(business):
@@ -103,3 +104,32 @@ def test_padder_regex_typeresolver_row_compile(business):
         if k != -1:  # ignore noise group for dbscan
             for value in business.loc[patterns[k].top(pattern=True).idx, 'Address ']:
                 assert pat.top(pattern=True).compare(value, dt)
+
+
+def test_padder_align_parallel(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    groups = Cluster(dist='TED', min_samples=3).collect(rows)
+    padded_tokens = Padder().align(rows, groups)
+    for backend in ['thread', 'process']:
+        parallel = Padder(n_jobs=2, backend=backend).align(rows, groups)
+        assert [[t.regex_type for t in row] for row in parallel] == [[t.regex_type for t in row] for row in padded_tokens]
+
+
+def test_padder_shared_gap():
+    rows = DefaultTokenizer().encode(['10 Main St', 'Broadway', '5 W 4th Ave'])
+    groups = {0: [0, 1, 2]}
+    padded_tokens = Padder().align(rows, groups)
+
+    gaps = [t for row in padded_tokens for t in row if t.regex_type == SupportedDataTypes.GAP]
+    assert gaps and all(t is GAP_TOKEN for t in gaps)
+    assert all(len(row) == len(rows[2]) for row in padded_tokens)
+    try:
+        GAP_TOKEN.rowidx = 1
+        assert False
+    except AttributeError:
+        pass
+
+    # the row indices of the padded rows come from the groups
+    patterns = DefaultRegexCompiler(method='col', per_group='all').compile(padded_tokens, groups)
+    assert None not in set.union(*[p.idx for p in patterns[0].values()])
@@ -11,7 +11,7 @@ from openclean_pattern.align.progressive import ProgressiveAligner
 from openclean_pattern.tokenize.factory import DefaultTokenizer, RegexTokenizer
 from openclean_pattern.datatypes.base import SupportedDataTypes
 from openclean_pattern.datatypes.resolver import DefaultTypeResolver, DateResolver
-from openclean_pattern.align.base import Alignment
+from openclean_pattern.align.base import Alignment, Sequence
 
 ADDRESSES = ['123 ST', '21W.AVENUE', 'WEST ALLEN 12']
 
@@ -172,3 +172,88 @@ def test_progressive_align_dates_nonbasic(dates):
     assert al[0][0].regex_type == SupportedDataTypes.MONTH
     assert al[0][1].regex_type == SupportedDataTypes.SPACE_REP
     assert al[0][2].regex_type == SupportedDataTypes.DIGIT
+
+
+def test_progressive_profile_cost():
+    """the profile cost of each cell is the sum of the distances of all token pairs"""
+    dt = DefaultTokenizer()
+    encoded = dt.encode(ADDRESSES)
+
+    pa = ProgressiveAligner()
+    x = Alignment(pa.pairwise.align([encoded[0], encoded[1]]))
+    aln = pa._get_pairs(x)
+    seq = pa._get_pairs(Sequence.from_tokens(encoded[2]))
+
+    cost = pa._profile_cost(aln, seq)
+    for i in seq:
+        for j in aln:
+            assert cost[i + 1, j + 1] == pa._pairwise_dist(aln[j], seq[i])
+
+
+def test_progressive_resolve_alignment():
+    """gaps are placed the same as with repeated insert_gap calls"""
+    encoded = DefaultTokenizer().encode(ADDRESSES)
+    GAP = SupportedDataTypes.GAP
+
+    x = Alignment.from_sequences([Sequence.from_tokens(encoded[0]), Sequence.from_tokens(encoded[0])])
+    y = Sequence.from_tokens(encoded[1])
+    gap_info = [(0, GAP), (1, 0), (GAP, 1), (2, 2)]
+
+    expected_x, expected_y = x, y
+    for n, (j, i) in enumerate(gap_info):
+        if i is GAP:
+            expected_x = expected_x.insert_gap(n)
+        if j is GAP:
+            expected_y = expected_y.insert_gap(n)
+
+    aln = ProgressiveAligner()._resolve_alignment(gap_info, x, y)
+    assert len(aln) == 3
+    for row, expected in zip(aln, list(expected_x) + [expected_y]):
+        assert [t.regex_type for t in row] == [t.regex_type for t in expected]
+
+
+def test_progressive_align_distinct():
+    """rows with the same signature get the gaps of their aligned signature"""
+    encoded = DefaultTokenizer().encode(ADDRESSES + ['456 AVE', '7 BLVD'])
+
+    aln = ProgressiveAligner(use_guide_tree=False).align(encoded, {0: [0, 1, 2, 3, 4]})[0]
+    assert len(aln) == 5
+    assert len({len(row) for row in aln}) == 1
+
+    # the rows 3 and 4 get the layout of row 0
+    assert [t.value for t in aln[3] if t.regex_type != SupportedDataTypes.GAP] == ['456', ' ', 'ave']
+    assert [t.value for t in aln[4] if t.regex_type != SupportedDataTypes.GAP] == ['7', ' ', 'blvd']
+    for row in aln[3:]:
+        assert [t.regex_type for t in row] == [t.regex_type for t in aln[0]]
+
+
+def test_progressive_align_distinct_order():
+    """the rows of a group with duplicate signatures keep the order of the group"""
+    encoded = DefaultTokenizer().encode(ADDRESSES + ['456 AVE', '7 BLVD'])
+    idx = [3, 1, 0, 4, 2]
+
+    for use_guide_tree in [False, True]:
+        aln = ProgressiveAligner(use_guide_tree=use_guide_tree).align(encoded, {0: idx})[0]
+        assert len(aln) == len(idx)
+        for row, i in zip(aln, idx):
+            assert [t.value for t in row if t.regex_type != SupportedDataTypes.GAP] == [t.value for t in encoded[i]]
+
+
+def test_progressive_align_parallel():
+    encoded = DefaultTokenizer().encode(ADDRESSES + ['456 AVE', '7 BLVD', 'W 4 ST'])
+    groups = {0: [0, 1, 2], 1: [3], 2: [4, 5]}
+
+    aligned = ProgressiveAligner().align(encoded, groups)
+    for backend in ['thread', 'process']:
+        parallel = ProgressiveAligner(n_jobs=2, backend=backend).align(encoded, groups)
+        assert len(parallel) == 3
+        for aln, expected in zip(parallel, aligned):
+            assert [[t.regex_type for t in row] for row in aln] == [[t.regex_type for t in row] for row in expected]
+
+
+def test_progressive_align_band():
+    encoded = DefaultTokenizer().encode(ADDRESSES)
+
+    aligned = ProgressiveAligner(use_guide_tree=False).align(encoded, {0: [0, 1, 2]})[0]
+    banded = ProgressiveAligner(use_guide_tree=False, band=1).align(encoded, {0: [0, 1, 2]})[0]
+    assert [[t.regex_type for t in row] for row in banded] == [[t.regex_type for t in row] for row in aligned]
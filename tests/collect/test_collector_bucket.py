@@ -0,0 +1,38 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for BucketCluster collector class"""
+
+from openclean_pattern.collect.bucket import BucketCluster
+from openclean_pattern.collect.cluster import Cluster
+from openclean_pattern.collect.factory import CollectorFactory
+from openclean_pattern.tokenize.factory import DefaultTokenizer
+
+
+def test_bucket_cluster_collect(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    groups = BucketCluster(min_samples=2).collect(rows)
+    parallel = CollectorFactory.create_collector('bucket', min_samples=2, n_jobs=2).collect(rows)
+    assert parallel == groups
+
+    assert sorted(i for idx in groups.values() for i in idx) == list(range(len(rows)))
+    for group, idx in groups.items():
+        if group != -1:
+            # clusters never mix rows with different no. of tokens
+            assert len({len(rows[i]) for i in idx}) == 1
+
+    # with a single band, the clusters are the ones of the Cluster collector
+    groups = BucketCluster(band=100, min_samples=3).collect(rows)
+    assert groups == Cluster(min_samples=3).collect(rows)
+
+
+def test_bucket_cluster_sample(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    groups = BucketCluster(max_bucket_size=5, min_samples=2, eps=.3).collect(rows)
+    assert sorted(i for idx in groups.values() for i in idx) == list(range(len(rows)))
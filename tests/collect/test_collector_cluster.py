@@ -38,3 +38,12 @@ def test_distance_absolute_compute(business):
             for id in idx:
                 assert len(rows[id]) == leng
 
+
+
+def test_cluster_distinct_signatures(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    groups = Cluster(dist='TED', min_samples=3).collect(rows)
+    distinct = Cluster(dist='TED', min_samples=3, distinct=True).collect(rows)
+
+    assert distinct == groups
@@ -0,0 +1,68 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for MinHashLSH collector class"""
+
+from openclean_pattern.collect.factory import CollectorFactory
+from openclean_pattern.collect.minhash import MinHashLSH
+from openclean_pattern.tokenize.regex import DefaultTokenizer
+
+import numpy as np
+
+
+def test_minhash_collect(business):
+    encoded = DefaultTokenizer().encode(business['Address '])
+
+    groups = MinHashLSH().collect(encoded)
+
+    # every row is in exactly one group
+    assert sorted(i for idx in groups.values() for i in idx) == list(range(len(encoded)))
+
+
+def test_minhash_similar():
+    encoded = DefaultTokenizer().encode(
+        ['12 main st', '12 main st 5', '2020-01-01', '2020-01-01 10:30', 'main st', '12 main st apt 3']
+    )
+
+    groups = MinHashLSH(random_state=42).collect(encoded)
+    label = {i: n for n, idx in groups.items() for i in idx}
+    # close but not identical signatures are merged
+    assert label[0] == label[1] == label[5]
+    assert label[2] == label[3]
+    # clearly different ones are not
+    assert label[0] != label[2]
+
+
+def test_minhash_threshold():
+    encoded = DefaultTokenizer().encode(['12 main st', '12 broadway av', '12 main st apt 3', '2020-01-01', '2021/10/10'])
+
+    groups = CollectorFactory.create_collector('minhash', threshold=.3, bands=32, rows=2).collect(encoded)
+    assert list(groups.values()) == [[0, 1, 2], [3, 4]]
+
+    # a threshold of 1 only merges identical shingle sets
+    groups = MinHashLSH(threshold=1).collect(encoded)
+    assert list(groups.values()) == [[0, 1], [2], [3, 4]]
+
+    sketches = MinHashLSH(bands=2, rows=3).sketch(encoded)
+    assert sketches.shape == (5, 6)
+    assert (sketches[0] == sketches[1]).all()
+
+
+def test_minhash_bucket_representatives():
+    encoded = DefaultTokenizer().encode(['main 12 st', 'main st', '12-main st', '12 main st apt'])
+    collector = MinHashLSH(bands=3, rows=2, threshold=.5, random_state=5)
+
+    # all rows share the bucket of the first band, row 2 is dissimilar to the first row of the bucket but similar
+    # to row 3 that comes later, and they don't share any other bucket
+    sketches = collector.sketch(encoded)
+    assert (sketches[:, :2] == sketches[0, :2]).all()
+    assert np.mean(sketches[2] == sketches[0]) < .5 <= np.mean(sketches[2] == sketches[3])
+    for band in [1, 2]:
+        assert (sketches[2, 2 * band:2 * band + 2] != sketches[3, 2 * band:2 * band + 2]).any()
+
+    groups = collector.collect(encoded)
+    assert list(groups.values()) == [[0, 2, 3], [1]]
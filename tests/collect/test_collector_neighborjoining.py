@@ -49,3 +49,15 @@ def test_neighborjoining_collect():
     actual = [1, 0, 2]
     for i, o in enumerate(order[0][0][0]):
         assert o == actual[i]
+
+
+def test_neighborjoining_distance_parallel(business):
+    dt = DefaultTokenizer()
+    encoded = dt.encode(business['Address '])
+
+    dists = NeighborJoin()._compute_pairwise_distance(encoded)
+    parallel = NeighborJoin(n_jobs=2)._compute_pairwise_distance(encoded)
+
+    assert dists.shape == (len(encoded), len(encoded))
+    assert (dists == parallel).all()
+    assert (dists == dists.T).all()
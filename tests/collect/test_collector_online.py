@@ -0,0 +1,55 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for OnlineCluster collector class"""
+
+from openclean_pattern.collect.base import signature
+from openclean_pattern.collect.factory import CollectorFactory
+from openclean_pattern.collect.online import OnlineCluster
+from openclean_pattern.tokenize.factory import DefaultTokenizer
+
+
+def test_online_cluster_collect(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    groups = CollectorFactory.create_collector('online').collect(rows)
+    assert sorted(i for idx in groups.values() for i in idx) == list(range(len(rows)))
+
+    # rows with the same signature always end up in the same cluster
+    clusters = dict()
+    for n, idx in groups.items():
+        for i in idx:
+            assert clusters.setdefault(signature(rows[i]), n) == n
+
+
+def test_online_cluster_stream(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    collector = OnlineCluster(max_clusters=4, consolidate_every=10)
+    labels = list()
+    for start in range(0, len(rows), 7):
+        for row in rows[start:start + 7]:
+            labels.append(collector.add(row))
+            assert collector.find(labels[-1]) in collector.representatives
+        assert len(collector.representatives) <= 4
+
+    assert len(labels) == len(rows)
+    assert sum(rep.size for rep in collector.representatives.values()) == len(rows)
+
+
+def test_online_cluster_bounded_state(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    collector = OnlineCluster(max_clusters=4, consolidate_every=10, cache_size=32)
+    for _ in range(20):
+        labels = collector.partial_fit(rows)
+        assert len(collector.parent) <= 4
+        assert set(collector.seen.values()) <= set(collector.representatives)
+    assert collector.consolidations > 20
+
+    # the labels since the last consolidation still resolve to live clusters
+    assert {collector.find(label) for label in labels[-10:]} <= set(collector.representatives)
@@ -0,0 +1,35 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for RadiusCluster class"""
+
+from openclean_pattern.collect.cluster import Cluster
+from openclean_pattern.collect.factory import CollectorFactory
+from openclean_pattern.collect.radius import RadiusCluster
+from openclean_pattern.tokenize.factory import DefaultTokenizer
+
+
+def test_radius_cluster_collect(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    for dist in ['TED', 'ABS']:
+        for eps in [.1, .3]:
+            groups = Cluster(dist=dist, eps=eps, min_samples=3).collect(rows)
+            radius = RadiusCluster(dist=dist, eps=eps, min_samples=3, block_size=10).collect(rows)
+            assert radius == groups
+
+
+def test_radius_cluster_sparse(business):
+    rows = DefaultTokenizer().encode(business['Address '])
+
+    rc = CollectorFactory.create_collector('radius', eps=.1)
+    graph = rc._neighbors(rows)
+    dense = Cluster(dist='TED')._precompute_distance(rows)
+    # only the close pairs are stored
+    assert graph.nnz == (dense <= .1).sum()
+    for u, v in zip(*graph.nonzero()):
+        assert graph[u, v] == dense[u, v]
@@ -0,0 +1,48 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for SignatureGroup collector class"""
+
+from openclean_pattern.collect.factory import CollectorFactory
+from openclean_pattern.collect.signature import SignatureGroup
+from openclean_pattern.tokenize.regex import DefaultTokenizer
+
+VALUES = ['12 main st', 'w12 main st', '34 broadway av', 'main 12', 'w.12 st', 'ab main st', 'x.12 ab']
+
+
+def test_signature_collect():
+    encoded = DefaultTokenizer().encode(VALUES)
+
+    groups = SignatureGroup().collect(encoded)
+    assert list(groups.values()) == [[0, 2], [1], [3], [4, 6], [5]]
+
+
+def test_signature_collect_loose():
+    encoded = DefaultTokenizer().encode(VALUES)
+
+    groups = CollectorFactory.create_collector('signature', strict=False).collect(encoded)
+    # digits and alphas are merged through the alphanum signature
+    assert list(groups.values()) == [[0, 1, 2, 5], [3], [4, 6]]
+
+
+def test_signature_collect_loose_punctuation():
+    encoded = DefaultTokenizer().encode(['12 main st', '12-main st', 'w12-main.st', '12 main'])
+
+    groups = SignatureGroup(strict=False).collect(encoded)
+    # spaces and punctuation are equal in the non-strict distance
+    assert list(groups.values()) == [[0, 1, 2], [3]]
+    assert SignatureGroup().collect(encoded)[0] == [0]
+
+
+def test_signature_collect_loose_through_alphanum():
+    encoded = DefaultTokenizer().encode(['12 st', 'ab st', 'x-1', '12.ave', 'w12 st'])
+
+    # alphas and digits are only merged once the alphanum signature appears
+    groups = SignatureGroup(strict=False).collect(encoded[:4])
+    assert list(groups.values()) == [[0, 3], [1], [2]]
+    groups = SignatureGroup(strict=False).collect(encoded)
+    assert list(groups.values()) == [[0, 1, 3, 4], [2]]
@@ -34,3 +34,23 @@ def test_default_resolver_with_interceptor(dates):
     assert tokens[6].regex_type == SupportedDataTypes.PUNCTUATION
     assert tokens[7].regex_type == SupportedDataTypes.SPACE_REP
     assert tokens[8].regex_type == SupportedDataTypes.DIGIT
+
+
+def test_default_resolver_adaptive(dates):
+    dt = DateResolver()
+    tr = DefaultTypeResolver(interceptors=[dt], adaptive=True, sample_size=2, min_hit_rate=0.6)
+    rt = RegexTokenizer(type_resolver=tr)
+
+    # the date resolver is skipped for a numeric column
+    tokens = rt.encode(['123', '4567', '89 10', 'mar 12'])
+    assert tr.kept == []
+    assert tr.hit_rates[0] < 0.6
+    assert tokens[3][0].regex_type == SupportedDataTypes.ALPHA
+
+    # and kept for a date column
+    tokens = rt.encode(dates)
+    assert tr.kept == [dt]
+    assert tokens[0][0].regex_type == SupportedDataTypes.WEEKDAY
+
+    tr.reset()
+    assert tr.kept == [dt]
@@ -0,0 +1,49 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for the fused type resolver class"""
+
+import pytest
+
+from openclean_pattern.datatypes.base import SupportedDataTypes
+from openclean_pattern.datatypes.resolver import AdvancedTypeResolver, BasicTypeResolver, DateResolver, \
+    DefaultTypeResolver, FusedTypeResolver
+from openclean_pattern.tokenize.regex import RegexTokenizer
+
+VALUES = [
+    'Monday, 21st March, 2019',
+    'march county, new york',
+    'sun 12 new york city march',
+    'New Jersey',
+    '123 Main St'
+]
+
+
+def counties():
+    return AdvancedTypeResolver(
+        vocabulary=[(['march county', 'new york', 'new york city', 'sun valley'], SupportedDataTypes.COUNTY)]
+    )
+
+
+def test_fused_resolver_matches_default():
+    default = RegexTokenizer(type_resolver=DefaultTypeResolver(interceptors=[DateResolver(), counties()]))
+    fused = RegexTokenizer(type_resolver=FusedTypeResolver(interceptors=[DateResolver(), counties()]))
+    for value in VALUES:
+        expected = default.tokens(value)
+        tokens = fused.tokens(value)
+        assert [t.regex_type for t in tokens] == [t.regex_type for t in expected]
+        assert [str(t) for t in tokens] == [str(t) for t in expected]
+
+    # the date resolver takes priority over the county
+    tokens = fused.tokens('march county')
+    assert tokens[0].regex_type == SupportedDataTypes.MONTH
+    assert tokens[2].regex_type == SupportedDataTypes.ALPHA
+
+
+def test_fused_resolver_interceptor_type():
+    with pytest.raises(TypeError):
+        FusedTypeResolver(interceptors=[BasicTypeResolver()])
@@ -0,0 +1,44 @@
+# This file is part of the Pattern and Anomaly Detection Library (openclean_pattern).
+#
+# Copyright (C) 2021 New York University.
+#
+# openclean_pattern is released under the Revised BSD License. See file LICENSE for
+# full license details.
+
+"""unit tests for the typo tolerant type resolver class"""
+
+from openclean_pattern.datatypes.base import SupportedDataTypes
+from openclean_pattern.datatypes.resolver import AdvancedTypeResolver, DateResolver, DefaultTypeResolver, \
+    FuzzyTypeResolver
+from openclean_pattern.tokenize.regex import RegexTokenizer
+from openclean_pattern.utils.utils import StringComparator
+
+
+def test_fuzzy_resolver_typos():
+    streets = AdvancedTypeResolver(vocabulary=[(['avenue', 'street', 'st', 'ave', 'new york'], SupportedDataTypes.STREET)])
+    rt = RegexTokenizer(type_resolver=DefaultTypeResolver(interceptors=FuzzyTypeResolver(streets)))
+
+    tokens = rt.tokens('12 W Stret, New York avnue sreet')
+    assert tokens[4].regex_type == SupportedDataTypes.STREET
+    assert tokens[4] == 'stret'
+    assert tokens[7].regex_type == SupportedDataTypes.STREET
+    assert tokens[9].regex_type == SupportedDataTypes.STREET
+    assert tokens[11].regex_type == SupportedDataTypes.STREET
+
+    # short and numeric tokens are only matched exactly
+    tokens = rt.tokens('sx 1234 aveeenue')
+    assert tokens[0].regex_type == SupportedDataTypes.ALPHA
+    assert tokens[2].regex_type == SupportedDataTypes.DIGIT
+    assert tokens[4].regex_type == SupportedDataTypes.ALPHA
+
+
+def test_fuzzy_resolver_distance():
+    dt = FuzzyTypeResolver(DateResolver(), max_distance=2)
+    assert dt.lookup('wednsday') == SupportedDataTypes.WEEKDAY
+    assert dt.lookup('setpember') == SupportedDataTypes.MONTH
+    assert dt.lookup('decmbr') == SupportedDataTypes.MONTH
+    assert dt.lookup('year') is None
+
+    assert StringComparator.edit_distance('avnue', 'avenue') == 1
+    assert StringComparator.edit_distance('setpember', 'september') == 1
+    assert StringComparator.edit_distance('', 'abc') == 3
@@ -31,3 +31,30 @@ def test_prefix_tree_lookup(sequence, result):
     assert index == result
     expected_label = 'TEST' if result is not None else None
     assert label == expected_label
+
+
+def test_prefix_tree_cursor():
+    """Test walking the prefix tree one token at a time."""
+    pt = PrefixTree(vocabulary=[(['New York', 'New York City', 'c/o'], 'TEST')])
+    node = pt.advance(pt.root, 'NEW')
+    assert node is not None
+    assert pt.label(node) is None
+    node = pt.advance(node, 'york')
+    assert pt.label(node) == 'TEST'
+    assert pt.advance(node, 'state') is None
+    # Tokens containing the trie separator span multiple levels.
+    assert pt.label(pt.advance(pt.root, 'C/O')) == 'TEST'
+    # Search from an offset inside the token list.
+    tokens = [Token('in'), Token('new'), Token(' '), Token('york'), Token(' '), Token('city')]
+    assert pt.prefix_search(tokens, start=1) == (5, 'TEST')
+    assert pt.prefix_search(tokens, start=0) == (None, None)
+
+
+def test_prefix_tree_may_start():
+    """Test the first token filter of the prefix tree."""
+    pt = PrefixTree(vocabulary=[(['New York', 'Boston', 'c/o'], 'TEST')])
+    assert pt.may_start('NEW')
+    assert pt.may_start('boston')
+    assert pt.may_start('c/o')
+    assert not pt.may_start('york')
+    assert not pt.may_start('14')
@@ -10,6 +10,10 @@
 from openclean_pattern.datatypes.base import SupportedDataTypes as DT
 from openclean_pattern.opencleanpatternfinder import OpencleanPatternFinder
 from openclean_pattern.regex.compiler import DefaultRegexCompiler
+from openclean_pattern.collect.cluster import Cluster
+from openclean_pattern.collect.neighbor import NeighborJoin
+from openclean_pattern.collect.radius import RadiusCluster
+from openclean_pattern.tokenize.factory import DefaultTokenizer
 
 
 def test_patternfinder_find(business):
@@ -44,3 +48,54 @@ def test_patternfinder_find(business):
     for k, pat in patterns[9].items():
         for elements, type in zip(pat.container, types):
             assert elements.element_type == type
+
+
+def test_patternfinder_budget(business, caplog):
+    """test the fallbacks of quadratic collectors over the budget"""
+    pf = OpencleanPatternFinder(collector='cluster', aligner='pad', max_memory=1024)
+    with caplog.at_level('WARNING'):
+        patterns = pf.find(series=business['Address '])
+    assert 'falling back to the group collector' in caplog.text
+    assert len(patterns) == 4
+
+    caplog.clear()
+    pf = OpencleanPatternFinder(collector='cluster', aligner='pad', max_memory=8 * 10 * 10, fallback=None)
+    with caplog.at_level('WARNING'):
+        pf.find(series=business['Address '])
+    assert 'sampling 10 rows' in caplog.text
+    assert len(pf.values) == 10
+    assert len(pf._aligned) == 10
+    # the row indices of the tokens and the patterns point to the sampled values
+    assert all(t.rowidx == i for i, row in enumerate(pf._aligned) for t in row if t.rowidx is not None)
+    for pattern in pf.patterns.values():
+        top = pattern.top(pattern=True)
+        assert max(top.idx) < len(pf.values)
+        assert all(top.compare(list(pf._aligned[i])) for i in top.idx)
+
+    # no budget by default
+    caplog.clear()
+    pf = OpencleanPatternFinder(collector='cluster', aligner='pad')
+    assert pf.max_memory is None and pf.max_operations is None
+    with caplog.at_level('WARNING'):
+        pf.find(series=business['Address '])
+    assert 'over the budget' not in caplog.text
+    assert pf._collector.collector_type == 'cluster'
+
+
+def test_patternfinder_budget_distinct(caplog):
+    """test that the estimates of deduping collectors depend on the no. of distinct signatures"""
+    values = ['{} main st'.format(i) for i in range(2000)] + ['apt {}'.format(i) for i in range(2000)]
+    rows = DefaultTokenizer().encode(values)
+    assert Cluster().estimate(rows)[0] == 8 * 4000 * 4000
+    assert Cluster(distinct=True).estimate(rows)[0] == 8 * 2 * 2
+    # neighbor joining still runs on all the rows
+    assert NeighborJoin().estimate(rows) == (8 * (2 * 2 + 4000 * 4000), 3 * 4 ** 2 + 4000 ** 3)
+    # the two signatures have different lengths and are too far apart to be compared
+    assert RadiusCluster(eps=.1).estimate(rows) == (8, 5 + 3)
+
+    pf = OpencleanPatternFinder(collector=Cluster(distinct=True, min_samples=2), aligner='pad', max_memory=2 ** 20)
+    with caplog.at_level('WARNING'):
+        patterns = pf.find(series=values)
+    assert 'over the budget' not in caplog.text
+    assert len(pf.values) == 4000
+    assert len(patterns) == 2